@@ -47,6 +47,11 @@ else:
         normalize_tick_counter,
     )
 
+try:  # Optional SIMD-accelerated JSON parsing for large world files.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is not a required dependency
+    from json import loads as _json_loads
+
 DEFAULT_WORLD_PATH = "world/world.json"
 BASE_LINE_WIDTH = 80
 MIN_LINE_WIDTH = 50
@@ -96,24 +101,31 @@ INLINE_COLOR_MAP = {
     "danger": "\033[31m",
 }
 INLINE_FORMAT_PATTERN = re.compile(r"\{([a-zA-Z_]+):([^}]+)\}")
+_INLINE_SUB = INLINE_FORMAT_PATTERN.sub
+
+
+def _strip_markup(match: "re.Match[str]") -> str:
+    return match.group(2)
+
+
+def _colorize_markup(match: "re.Match[str]", _color_get=INLINE_COLOR_MAP.get) -> str:
+    # The pattern only matches [a-zA-Z_]+ kinds, so no strip() is needed;
+    # lower() keeps {Trait:...} working.
+    value = match.group(2)
+    color = _color_get(match.group(1).lower())
+    if not color:
+        return value
+    return f"{color}{value}{ANSI_RESET}"
 
 
 def print_formatted(text: str) -> str:
+    # Module-level callbacks: the substitution runs in one precompiled-regex
+    # pass and no closure is rebuilt per call.
     if not text or "{" not in text:
         return text
-
     if IS_WEB:
-        return INLINE_FORMAT_PATTERN.sub(lambda match: match.group(2), text)
-
-    def replace(match: re.Match[str]) -> str:
-        kind = match.group(1).strip().lower()
-        value = match.group(2)
-        color = INLINE_COLOR_MAP.get(kind)
-        if not color:
-            return value
-        return f"{color}{value}{ANSI_RESET}"
-
-    return INLINE_FORMAT_PATTERN.sub(replace, text)
+        return _INLINE_SUB(_strip_markup, text)
+    return _INLINE_SUB(_colorize_markup, text)
 
 
 def canonical_tag(tag):
@@ -503,8 +515,7 @@ def _merge_world_modules(world, world_path):
             _raise_world_validation(["module entries must be non-empty strings."])
         module_path = (base_dir / module_ref).resolve()
         try:
-            with open(module_path, "r", encoding="utf-8") as handle:
-                module = json.load(handle)
+            module = _json_loads(Path(module_path).read_bytes())
         except FileNotFoundError:
             _raise_world_validation(
                 [f"{module_path}: module file not found (check world.json modules list)"]
@@ -550,8 +561,7 @@ def _merge_world_modules(world, world_path):
 
 
 def load_world(path):
-    with open(path, "r", encoding="utf-8") as f:
-        world = json.load(f)
+    world = _json_loads(Path(path).read_bytes())
     if not isinstance(world, dict):
         _raise_world_validation(["World data must be a JSON object."])
 
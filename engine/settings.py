@@ -6,7 +6,7 @@ import json
 import os
 import sys
 import tempfile
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
@@ -18,6 +18,50 @@ def _clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(maximum, value))
 
 
+def _as_float(data: Dict[str, Any], key: str, default: float) -> float:
+    value = data.get(key, default)
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_bool(data: Dict[str, Any], key: str, default: bool) -> bool:
+    value = data.get(key, default)
+    if type(value) is bool:
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in {"true", "1", "yes", "on"}:
+            return True
+        if lowered in {"false", "0", "no", "off"}:
+            return False
+    return bool(value) if value is not None else default
+
+
+def _as_str(data: Dict[str, Any], key: str, default: str) -> str:
+    return str(data.get(key, default))
+
+
+# Field name -> (parser, default), shared by from_dict so the parsing plan is
+# built once at import instead of re-created via closures on every call.
+_FIELD_PARSERS = (
+    ("audio_master", _as_float, 1.0),
+    ("audio_music", _as_float, 1.0),
+    ("audio_sfx", _as_float, 1.0),
+    ("window_mode", _as_str, "windowed"),
+    ("vsync", _as_bool, True),
+    ("ui_scale", _as_float, 1.0),
+    ("text_speed", _as_float, 0.0),
+    ("high_contrast", _as_bool, False),
+    ("reduce_animations", _as_bool, False),
+    ("caption_audio_cues", _as_bool, False),
+    ("doom_clock_enabled", _as_bool, True),
+)
+
+
 @dataclass
 class Settings:
     """Runtime configuration toggles that persist between sessions."""
@@ -59,43 +103,26 @@ class Settings:
         return Settings.from_dict(self.to_dict())
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "audio_master": self.audio_master,
+            "audio_music": self.audio_music,
+            "audio_sfx": self.audio_sfx,
+            "window_mode": self.window_mode,
+            "vsync": self.vsync,
+            "ui_scale": self.ui_scale,
+            "text_speed": self.text_speed,
+            "high_contrast": self.high_contrast,
+            "reduce_animations": self.reduce_animations,
+            "caption_audio_cues": self.caption_audio_cues,
+            "doom_clock_enabled": self.doom_clock_enabled,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any] | None) -> "Settings":
         if not isinstance(data, dict):
             return cls()
-
-        def _as_float(key: str, default: float) -> float:
-            try:
-                return float(data.get(key, default))
-            except (TypeError, ValueError):
-                return default
-
-        def _as_bool(key: str, default: bool) -> bool:
-            value = data.get(key, default)
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                lowered = value.strip().lower()
-                if lowered in {"true", "1", "yes", "on"}:
-                    return True
-                if lowered in {"false", "0", "no", "off"}:
-                    return False
-            return bool(value) if value is not None else default
-
         settings = cls(
-            audio_master=_as_float("audio_master", 1.0),
-            audio_music=_as_float("audio_music", 1.0),
-            audio_sfx=_as_float("audio_sfx", 1.0),
-            window_mode=str(data.get("window_mode", "windowed")),
-            vsync=_as_bool("vsync", True),
-            ui_scale=_as_float("ui_scale", 1.0),
-            text_speed=_as_float("text_speed", 0.0),
-            high_contrast=_as_bool("high_contrast", False),
-            reduce_animations=_as_bool("reduce_animations", False),
-            caption_audio_cues=_as_bool("caption_audio_cues", False),
-            doom_clock_enabled=_as_bool("doom_clock_enabled", True),
+            **{name: parser(data, name, default) for name, parser, default in _FIELD_PARSERS}
         )
         return settings.clamp()
 
@@ -115,15 +142,24 @@ def load_settings(path: Path | str = SETTINGS_PATH) -> Settings:
 def save_settings(settings: Settings, path: Path | str = SETTINGS_PATH) -> Settings:
     path = Path(path)
     sanitized = settings.copy().clamp()
+    new_bytes = (json.dumps(sanitized.to_dict(), indent=2) + "\n").encode("utf-8")
+
+    # Skip the temp-file rewrite entirely when the on-disk contents already
+    # match; closing the options menu without touching anything is common.
+    try:
+        if path.read_bytes() == new_bytes:
+            return sanitized
+    except OSError:
+        pass
+
     path.parent.mkdir(parents=True, exist_ok=True)
 
     tmp_path: Path | None = None
     try:
         with tempfile.NamedTemporaryFile(
-            "w", delete=False, dir=path.parent, prefix=path.name, suffix=".tmp", encoding="utf-8"
+            "wb", delete=False, dir=path.parent, prefix=path.name, suffix=".tmp"
         ) as tmp_file:
-            json.dump(sanitized.to_dict(), tmp_file, indent=2)
-            tmp_file.write("\n")
+            tmp_file.write(new_bytes)
             tmp_path = Path(tmp_file.name)
         os.replace(str(tmp_path), str(path))
     except OSError as exc:
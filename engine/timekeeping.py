@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Mapping
+from typing import Iterable, List, Mapping
+
+try:  # Optional acceleration for batch tick math.
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is not a required dependency
+    _np = None
+
+try:
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - numba is not a required dependency
+    _njit = None
+
+HAVE_NUMPY = _np is not None
+HAVE_NUMBA = _njit is not None
 
 ACTION_TICK_COSTS: Mapping[str, int] = {
     "move": 4,
@@ -22,16 +35,32 @@ def normalize_tick_counter(value: object) -> int:
     return max(tick, 0)
 
 
+# Inline fast path: tick counters are almost always already non-negative
+# ints, so hot callers test that directly and only fall back to the full
+# coercion in normalize_tick_counter for odd inputs.
+
+
 def increment_ticks(current_ticks: int, action_type: str) -> int:
+    ticks = (
+        current_ticks
+        if type(current_ticks) is int and current_ticks >= 0
+        else normalize_tick_counter(current_ticks)
+    )
     cost = ACTION_TICK_COSTS.get(action_type, 0)
     if cost <= 0:
-        return normalize_tick_counter(current_ticks)
-    return normalize_tick_counter(current_ticks) + cost
+        return ticks
+    return ticks + cost
 
 
 def cycle_position(tick_counter: int, *, cycle_length: int = CYCLE_LENGTH) -> int:
-    cycle_length = max(int(cycle_length), 1)
-    return normalize_tick_counter(tick_counter) % cycle_length
+    if type(cycle_length) is not int or cycle_length < 1:
+        cycle_length = max(int(cycle_length), 1)
+    ticks = (
+        tick_counter
+        if type(tick_counter) is int and tick_counter >= 0
+        else normalize_tick_counter(tick_counter)
+    )
+    return ticks % cycle_length
 
 
 def is_time_window(
@@ -41,20 +70,103 @@ def is_time_window(
     *,
     cycle_length: int = CYCLE_LENGTH,
 ) -> bool:
-    cycle_length = max(int(cycle_length), 1)
+    if type(cycle_length) is not int or cycle_length < 1:
+        cycle_length = max(int(cycle_length), 1)
     start = int(start) % cycle_length
     end = int(end) % cycle_length
-    current = cycle_position(tick_counter, cycle_length=cycle_length)
-    if start <= end:
-        return start <= current <= end
-    return current >= start or current <= end
+    ticks = (
+        tick_counter
+        if type(tick_counter) is int and tick_counter >= 0
+        else normalize_tick_counter(tick_counter)
+    )
+    current = ticks % cycle_length
+    forward = start <= end
+    return (forward and start <= current <= end) or (
+        not forward and (current >= start or current <= end)
+    )
 
 
 def weekday_index(tick_counter: int, *, cycle_length: int = CYCLE_LENGTH, days: int = 7) -> int:
+    if type(cycle_length) is not int or cycle_length < 1:
+        cycle_length = max(int(cycle_length), 1)
+    if type(days) is not int or days < 1:
+        days = max(int(days), 1)
+    ticks = (
+        tick_counter
+        if type(tick_counter) is int and tick_counter >= 0
+        else normalize_tick_counter(tick_counter)
+    )
+    return (ticks // cycle_length) % days
+
+
+def doom_reached(tick_counter: int, *, threshold: int = DOOM_TICK_THRESHOLD) -> bool:
+    ticks = (
+        tick_counter
+        if type(tick_counter) is int and tick_counter >= 0
+        else normalize_tick_counter(tick_counter)
+    )
+    return ticks > int(threshold)
+
+
+if _np is not None:
+
+    def _cycle_position_array(ticks, cycle_length):  # pragma: no cover - numpy path
+        return _np.maximum(ticks, 0) % cycle_length
+
+    def _weekday_index_array(ticks, cycle_length, days):  # pragma: no cover - numpy path
+        return (_np.maximum(ticks, 0) // cycle_length) % days
+
+    if _njit is not None:  # pragma: no cover - numba path
+        _cycle_position_array = _njit(cache=True)(_cycle_position_array)
+        _weekday_index_array = _njit(cache=True)(_weekday_index_array)
+
+
+def cycle_position_batch(ticks: Iterable[int], *, cycle_length: int = CYCLE_LENGTH):
+    """Vectorized ``cycle_position`` over many tick counters.
+
+    Accepts any iterable of tick counters and returns a list; NumPy arrays
+    stay arrays (and go through the Numba-compiled kernel when available).
+    """
+    cycle_length = max(int(cycle_length), 1)
+    if _np is not None and isinstance(ticks, _np.ndarray):
+        return _cycle_position_array(ticks, cycle_length)
+    return [normalize_tick_counter(tick) % cycle_length for tick in ticks]
+
+
+def weekday_index_batch(
+    ticks: Iterable[int], *, cycle_length: int = CYCLE_LENGTH, days: int = 7
+):
+    """Vectorized ``weekday_index`` over many tick counters."""
     cycle_length = max(int(cycle_length), 1)
     days = max(int(days), 1)
-    return (normalize_tick_counter(tick_counter) // cycle_length) % days
+    if _np is not None and isinstance(ticks, _np.ndarray):
+        return _weekday_index_array(ticks, cycle_length, days)
+    return [
+        (normalize_tick_counter(tick) // cycle_length) % days for tick in ticks
+    ]
 
 
-def doom_reached(tick_counter: int, *, threshold: int = DOOM_TICK_THRESHOLD) -> bool:
-    return normalize_tick_counter(tick_counter) > int(threshold)
+def is_time_window_batch(
+    ticks: Iterable[int],
+    start: int,
+    end: int,
+    *,
+    cycle_length: int = CYCLE_LENGTH,
+):
+    """Vectorized ``is_time_window`` over many tick counters."""
+    cycle_length = max(int(cycle_length), 1)
+    start = int(start) % cycle_length
+    end = int(end) % cycle_length
+    if _np is not None and isinstance(ticks, _np.ndarray):
+        current = _cycle_position_array(ticks, cycle_length)
+        if start <= end:
+            return (current >= start) & (current <= end)
+        return (current >= start) | (current <= end)
+    results: List[bool] = []
+    for tick in ticks:
+        current = normalize_tick_counter(tick) % cycle_length
+        if start <= end:
+            results.append(start <= current <= end)
+        else:
+            results.append(current >= start or current <= end)
+    return results
@@ -2,27 +2,72 @@
 
 from __future__ import annotations
 
-from collections import Counter
-from dataclasses import dataclass
+from functools import lru_cache
 import json
-from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Sequence, Tuple
-
-ConditionValidator = Callable[[Mapping[str, Any], str], List[str]]
-EffectValidator = Callable[[Mapping[str, Any], str, Mapping[str, Any], Mapping[str, Any]], List[str]]
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Sequence,
+    Tuple,
+)
+
+ConditionValidator = Callable[[Mapping[str, Any], str], Sequence[str]]
+EffectValidator = Callable[
+    [Mapping[str, Any], str, Mapping[str, Any], Mapping[str, Any]], Sequence[str]
+]
+
+
+@lru_cache(maxsize=4096)
+def _render_part(part: object) -> Tuple[str, bool]:
+    # A world's errors reference the same handful of parts ("nodes", node
+    # IDs, small indices) over and over; memoizing turns the isidentifier
+    # scan and json.dumps escaping into a dict probe. Returns the rendered
+    # segment and whether it joins to the previous one with a dot.
+    if isinstance(part, int):
+        return f"[{part}]", False
+    if not isinstance(part, str):
+        part = str(part)
+    if part.isidentifier():
+        return part, True
+    return f"[{json.dumps(part)}]", False
 
 
 def path(*parts: object) -> str:
+    segments: List[str] = []
+    for part in parts:
+        try:
+            segment, dotted = _render_part(part)
+        except TypeError:  # unhashable part; render without caching
+            segment, dotted = _render_part.__wrapped__(part)
+        if dotted and segments:
+            segments.append(".")
+        segments.append(segment)
+    return "".join(segments)
+
+
+def path_ident(*parts: object) -> str:
+    """``path`` specialized for parts known to be identifiers or ints.
+
+    Skips the isidentifier/json.dumps branches entirely; callers use it for
+    fixed schema tokens like ``"nodes"`` or ``"choices"`` plus indices, and
+    keep the generic :func:`path` for user-supplied node IDs.
+    """
     path_str = ""
     for part in parts:
-        if isinstance(part, int):
+        if type(part) is int:
             path_str = f"{path_str}[{part}]"
-            continue
-        if not isinstance(part, str):
-            part = str(part)
-        if part.isidentifier():
-            path_str = f"{path_str}.{part}" if path_str else part
+        elif path_str:
+            path_str = f"{path_str}.{part}"
         else:
-            path_str = f'{path_str}[{json.dumps(part)}]'
+            path_str = part  # type: ignore[assignment]
     return path_str
 
 
@@ -32,177 +77,387 @@ def format_validation_message(path_str: str, context: str, message: str) -> str:
     return f"{path_str}: {message}"
 
 
+@lru_cache(maxsize=2048)
+def _is_nes_cached(value: str) -> bool:
+    # The same handful of flag/faction/tag strings recur across a world's
+    # conditions and effects; equality-keyed caching amortizes the scan to
+    # O(unique strings). The predicate is pure, so caching is safe.
+    return bool(value) and not value.isspace()
+
+
 def is_non_empty_str(value: Any) -> bool:
-    return isinstance(value, str) and value.strip() != ""
+    # Exact-type fast path: str.isspace is a single allocation-free C scan,
+    # unlike strip() which builds a new string. The isinstance branch keeps
+    # str subclasses working.
+    if value.__class__ is str:
+        return _is_nes_cached(value)
+    return isinstance(value, str) and value != "" and not value.isspace()
 
 
 def str_or_str_list(value: Any) -> bool:
+    if value.__class__ is str:
+        return _is_nes_cached(value)
     if isinstance(value, str):
-        return value.strip() != ""
+        return value != "" and not value.isspace()
     if isinstance(value, list) and value:
-        return all(isinstance(item, str) and item.strip() != "" for item in value)
+        return all(is_non_empty_str(item) for item in value)
     return False
 
 
+# Exact types produced by the JSON parser for simple literals; a single
+# hash-set membership beats the isinstance tuple walk on the hot path.
+_SIMPLE_TYPES = frozenset({str, int, bool, type(None)})
+
+
 def simple_value(value: Any) -> bool:
-    return value is None or isinstance(value, (str, int, bool))
+    # Subclasses (not produced by json.load, but allowed for programmatic
+    # callers) fall through to an isinstance check; bool is a subclass of
+    # int, so it needs no slot of its own there.
+    return type(value) in _SIMPLE_TYPES or isinstance(value, (str, int))
+
+
+# List-form node counts at or above this switch duplicate detection to a
+# vectorized numpy.unique pass (when numpy is installed).
+_BATCH_DUP_THRESHOLD = 512
 
 
 def normalize_nodes(
-    raw_nodes: Any, ctx: Any | None = None
+    raw_nodes: Any, ctx: Any | None = None, *, canonicalize: bool = False
 ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Normalize raw node data into an ``id -> payload`` dict.
+
+    With ``canonicalize=True`` each payload is shallow-copied with its
+    ``on_enter``/``choices`` sections coerced to tuples (malformed sections
+    are reported and replaced with empty tuples), so downstream validation
+    can iterate them without re-checking their shape per node.
+    """
     nodes: Dict[str, Dict[str, Any]] = {}
     errors: List[str] = []
-    node_ids: List[str] = []
+    duplicates: List[str] | None = None
 
-    def add_error(context: str, path_parts: Sequence[object], message: str) -> None:
-        path_str = path(*path_parts)
+    def add_error(context: str, path_parts: Sequence[object] | str, message: str) -> None:
+        # Call sites with fixed identifier/int parts pass a pre-rendered
+        # string (via path_ident); only user-supplied parts go through path().
+        path_str = path_parts if type(path_parts) is str else path(*path_parts)
         errors.append(format_validation_message(path_str, context, message))
         if ctx is not None:
             ctx.add(context, path_str, message)
 
+    # Bound to locals once: closure/global loads inside the per-node loops
+    # become LOAD_FAST, which adds up across thousands of nodes.
+    _add = add_error
+    _nes = is_non_empty_str
+
     if isinstance(raw_nodes, dict):
         for node_id, payload in raw_nodes.items():
-            if not is_non_empty_str(node_id):
-                add_error("Nodes", ("nodes",), "node identifiers must be non-empty strings.")
+            if not _nes(node_id):
+                _add(
+                    "Nodes",
+                    path_ident("nodes"),
+                    "node identifiers must be non-empty strings.",
+                )
                 continue
             if not isinstance(payload, dict):
-                add_error(
+                _add(
                     "Nodes",
                     ("nodes", node_id),
                     f"node '{node_id}' must be an object.",
                 )
                 continue
             nodes[node_id] = payload
-        node_ids = list(nodes.keys())
     elif isinstance(raw_nodes, list):
+        # For very large (procedurally generated) worlds, collect the IDs and
+        # find duplicates in one vectorized numpy.unique pass instead of N
+        # per-entry membership probes. numpy is imported lazily so small
+        # hand-authored worlds never pay for it, and its absence falls back
+        # to the single-pass check below.
+        batch_ids: List[str] | None = None
+        if len(raw_nodes) >= _BATCH_DUP_THRESHOLD:
+            try:
+                import numpy as _np
+            except ImportError:
+                _np = None  # type: ignore[assignment]
+            if _np is not None:
+                batch_ids = []
+        _mutable_mapping = MutableMapping
         for idx, entry in enumerate(raw_nodes, start=1):
-            if not isinstance(entry, MutableMapping):
-                add_error(
+            if not isinstance(entry, _mutable_mapping):
+                _add(
                     f"Node entry {idx}",
-                    ("nodes", idx - 1),
+                    path_ident("nodes", idx - 1),
                     "must be an object.",
                 )
                 continue
             node_id = entry.get("id")
-            if not is_non_empty_str(node_id):
-                add_error(
+            if not _nes(node_id):
+                _add(
                     f"Node entry {idx}",
-                    ("nodes", idx - 1, "id"),
+                    path_ident("nodes", idx - 1, "id"),
                     "is missing a valid 'id'.",
                 )
                 continue
-            node_ids.append(node_id)
-            payload = dict(entry)
-            payload.pop("id", None)
+            if batch_ids is not None:
+                batch_ids.append(node_id)
+            elif node_id in nodes:
+                if duplicates is None:
+                    duplicates = []
+                duplicates.append(node_id)
+            if type(entry) is dict:
+                # C-level copy + delete; 'id' is known present and valid here.
+                payload = entry.copy()
+                del payload["id"]
+            else:
+                payload = {key: value for key, value in entry.items() if key != "id"}
             nodes[node_id] = payload
+        if batch_ids:
+            values, counts = _np.unique(
+                _np.asarray(batch_ids, dtype=object), return_counts=True
+            )
+            repeated = values[counts > 1].tolist()
+            if repeated:
+                duplicates = repeated
     else:
         add_error(
             "World data",
-            ("nodes",),
+            path_ident("nodes"),
             "must be an object mapping IDs to node definitions or a list of node entries.",
         )
 
-    duplicates = [node_id for node_id, count in Counter(node_ids).items() if count > 1]
+    # Duplicates are only possible for list-form input (dict keys are unique
+    # by construction), and the single-pass check above allocates nothing
+    # unless a collision actually occurs.
     if duplicates:
         dup_list = ", ".join(sorted(set(duplicates)))
-        add_error("Nodes", ("nodes",), f"Duplicate node IDs found: {dup_list}.")
+        add_error("Nodes", path_ident("nodes"), f"Duplicate node IDs found: {dup_list}.")
+
+    if canonicalize:
+        for node_id, payload in nodes.items():
+            canonical = dict(payload)
+            on_enter = canonical.get("on_enter")
+            if on_enter is None:
+                canonical["on_enter"] = ()
+            elif isinstance(on_enter, (list, tuple)):
+                canonical["on_enter"] = tuple(on_enter)
+            else:
+                add_error(
+                    f"Node '{node_id}'",
+                    ("nodes", node_id, "on_enter"),
+                    "on_enter must be a list of effect objects if present.",
+                )
+                canonical["on_enter"] = ()
+            choices = canonical.get("choices")
+            if choices is None:
+                canonical["choices"] = ()
+            elif isinstance(choices, (list, tuple)):
+                canonical["choices"] = tuple(choices)
+            else:
+                add_error(
+                    f"Node '{node_id}'",
+                    ("nodes", node_id, "choices"),
+                    "choices must be provided as a list.",
+                )
+                canonical["choices"] = ()
+            nodes[node_id] = canonical
 
     return nodes, errors
 
 
-@dataclass(frozen=True)
-class ConditionSpec:
+class ConditionSpec(NamedTuple):
+    """Spec for one condition type; a NamedTuple keeps attribute reads at
+    C-level tuple indexing and is immutable by construction."""
+
     required_fields: Tuple[str, ...]
     optional_fields: Tuple[str, ...]
-    field_rules: Mapping[str, str]
+    field_rules: Tuple[Tuple[str, str], ...]
     validate: ConditionValidator
+    # Set forms of the field tuples, filled in by _finalize_specs. Presence
+    # checks become one C-level superset test: payload.keys() >= required_set.
+    required_set: FrozenSet[str] = frozenset()
+    allowed_set: FrozenSet[str] = frozenset()
 
 
-@dataclass(frozen=True)
-class EffectSpec:
+class EffectSpec(NamedTuple):
     required_fields: Tuple[str, ...]
     optional_fields: Tuple[str, ...]
-    field_rules: Mapping[str, str]
+    field_rules: Tuple[Tuple[str, str], ...]
     validate: EffectValidator
+    required_set: FrozenSet[str] = frozenset()
+    allowed_set: FrozenSet[str] = frozenset()
 
 
-def _validate_flag_eq(condition: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
-    flag = condition.get("flag")
-    value = condition.get("value")
-    if not is_non_empty_str(flag):
-        errors.append(f"{context}: 'flag_eq' requires a non-empty string 'flag'.")
-    if not simple_value(value):
-        errors.append(f"{context}: 'flag_eq' requires a simple literal 'value'.")
-    return errors
-
-
-def _validate_profile_flag_eq(condition: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
-    flag = condition.get("flag")
-    value = condition.get("value")
-    if not is_non_empty_str(flag):
-        errors.append(f"{context}: 'profile_flag_eq' requires a non-empty string 'flag'.")
-    if not simple_value(value):
-        errors.append(f"{context}: 'profile_flag_eq' requires a simple literal 'value'.")
-    return errors
-
-
-def _validate_profile_flag_bool(condition: Mapping[str, Any], context: str, name: str) -> List[str]:
-    errors: List[str] = []
-    flag = condition.get("flag")
-    if not is_non_empty_str(flag):
-        errors.append(f"{context}: '{name}' requires a non-empty string 'flag'.")
-    return errors
-
+def _finalize_specs(specs: MutableMapping[str, Any]) -> None:
+    """Derive the frozenset views once at import time."""
+    for name, spec in specs.items():
+        required = frozenset(spec.required_fields)
+        specs[name] = spec._replace(
+            required_set=required,
+            allowed_set=required | frozenset(spec.optional_fields) | {"type"},
+        )
 
-def _validate_has_tag(condition: Mapping[str, Any], context: str, name: str) -> List[str]:
-    errors: List[str] = []
-    value = condition.get("value")
-    if not str_or_str_list(value):
-        errors.append(f"{context}: '{name}' requires a tag or list of tags in 'value'.")
-    return errors
 
 
-def _validate_has_advanced_tag(condition: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
+# Failure-message templates shared by the name-parameterized validators and
+# the compiled-validator factory; parsed once at import and formatted only on
+# the error path.  _TEMPLATES collects the per-rule templates produced by the
+# factory so tooling can look them up by rule name.
+_TMPL_FLAG_NES = "{}: '{}' requires a non-empty string 'flag'."
+_TMPL_TAG_LIST = "{}: '{}' requires a tag or list of tags in 'value'."
+_TMPL_INT_VALUE = "{}: '{}' requires an integer 'value'."
+_TEMPLATES: Dict[str, str] = {}
+
+# The context slot is always first, so each validator binds the pre-rendered
+# suffix (template with an empty context) as a default and builds errors with
+# one C-level string concat instead of re-parsing the format string per call.
+
+
+def _flag_and_value_validator(rule: str) -> Callable[..., Sequence[str]]:
+    """Build a validator for rules that need a non-empty string ``flag`` and a
+    simple literal ``value`` (flag_eq, profile_flag_eq, set_flag, ...)."""
+    flag_suffix = f": '{rule}' requires a non-empty string 'flag'."
+    value_suffix = f": '{rule}' requires a simple literal 'value'."
+    # Compiled per rule (rather than a shared closure) so each rule gets its
+    # own code object: helper predicates and templates become LOAD_FAST
+    # defaults, and profilers attribute time to the individual rule.
+    name = f"_validate_{rule}"
+    source = (
+        f"def {name}(payload, context, *_,\n"
+        "        _nes=_nes, _simple=_simple, _no=_no,\n"
+        "        _flag_suffix=_flag_suffix, _value_suffix=_value_suffix):\n"
+        "    flag = payload.get('flag')\n"
+        "    value = payload.get('value')\n"
+        "    if _nes(flag) and _simple(value):\n"
+        "        return _no\n"
+        "    errors = []\n"
+        "    if not _nes(flag):\n"
+        "        errors.append(context + _flag_suffix)\n"
+        "    if not _simple(value):\n"
+        "        errors.append(context + _value_suffix)\n"
+        "    return errors\n"
+    )
+    namespace = {
+        "_nes": is_non_empty_str,
+        "_simple": simple_value,
+        "_no": _NO_ERRORS,
+        "_flag_suffix": flag_suffix,
+        "_value_suffix": value_suffix,
+    }
+    exec(compile(source, f"<world_schema:{rule}>", "exec"), namespace)
+    validator = namespace[name]
+    validator.__qualname__ = f"world_schema.{name}"
+    return validator
+
+
+def _validate_profile_flag_is_true(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _suffix: str = _TMPL_FLAG_NES.format("", "profile_flag_is_true"),
+) -> Sequence[str]:
+    if is_non_empty_str(condition.get("flag")):
+        return _NO_ERRORS
+    return (context + _suffix,)
+
+
+def _validate_profile_flag_is_false(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _suffix: str = _TMPL_FLAG_NES.format("", "profile_flag_is_false"),
+) -> Sequence[str]:
+    if is_non_empty_str(condition.get("flag")):
+        return _NO_ERRORS
+    return (context + _suffix,)
+
+
+def _validate_has_tag(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _suffix: str = _TMPL_TAG_LIST.format("", "has_tag"),
+) -> Sequence[str]:
+    if str_or_str_list(condition.get("value")):
+        return _NO_ERRORS
+    return (context + _suffix,)
+
+
+def _validate_has_trait(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _suffix: str = _TMPL_TAG_LIST.format("", "has_trait"),
+) -> Sequence[str]:
+    if str_or_str_list(condition.get("value")):
+        return _NO_ERRORS
+    return (context + _suffix,)
+
+
+def _validate_missing_tag(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _suffix: str = _TMPL_TAG_LIST.format("", "missing_tag"),
+) -> Sequence[str]:
+    if str_or_str_list(condition.get("value")):
+        return _NO_ERRORS
+    return (context + _suffix,)
+
+
+def _validate_has_advanced_tag(condition: Mapping[str, Any], context: str) -> Sequence[str]:
     value = condition.get("value", [])
-    if value not in (None, []):
-        if not str_or_str_list(value):
-            errors.append(
-                f"{context}: 'has_advanced_tag' requires tags as a string or list when provided."
-            )
-    return errors
-
-
-def _validate_rep_at_least(condition: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
+    if value in (None, []) or str_or_str_list(value):
+        return _NO_ERRORS
+    return (f"{context}: 'has_advanced_tag' requires tags as a string or list when provided.",)
+
+
+def _validate_rep_at_least(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _faction_suffix: str = ": 'rep_at_least' requires a non-empty string 'faction'.",
+    _value_suffix: str = ": 'rep_at_least' requires an integer 'value'.",
+) -> Sequence[str]:
     faction = condition.get("faction")
     value = condition.get("value")
+    if is_non_empty_str(faction) and isinstance(value, int):
+        return _NO_ERRORS
+    errors: List[str] = []
     if not is_non_empty_str(faction):
-        errors.append(f"{context}: 'rep_at_least' requires a non-empty string 'faction'.")
+        errors.append(context + _faction_suffix)
     if not isinstance(value, int):
-        errors.append(f"{context}: 'rep_at_least' requires an integer 'value'.")
+        errors.append(context + _value_suffix)
     return errors
 
 
-def _validate_has_var_gte(condition: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
+def _validate_has_var_gte(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _var_suffix: str = ": 'has_var_gte' requires a non-empty string 'var'.",
+    _value_suffix: str = ": 'has_var_gte' requires an integer 'value'.",
+) -> Sequence[str]:
     var = condition.get("var")
     value = condition.get("value")
+    if is_non_empty_str(var) and isinstance(value, int):
+        return _NO_ERRORS
+    errors: List[str] = []
     if not is_non_empty_str(var):
-        errors.append(f"{context}: 'has_var_gte' requires a non-empty string 'var'.")
+        errors.append(context + _var_suffix)
     if not isinstance(value, int):
-        errors.append(f"{context}: 'has_var_gte' requires an integer 'value'.")
+        errors.append(context + _value_suffix)
     return errors
 
 
-def _validate_rep_at_least_count(condition: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
+def _validate_rep_at_least_count(condition: Mapping[str, Any], context: str) -> Sequence[str]:
     value = condition.get("value")
     count = condition.get("count")
     factions = condition.get("factions")
+    if (
+        isinstance(value, int)
+        and (count is None or isinstance(count, int))
+        and (factions is None or str_or_str_list(factions))
+    ):
+        return _NO_ERRORS
+    errors: List[str] = []
     if not isinstance(value, int):
         errors.append(f"{context}: 'rep_at_least_count' requires an integer 'value'.")
     if count is not None and not isinstance(count, int):
@@ -214,18 +469,38 @@ def _validate_rep_at_least_count(condition: Mapping[str, Any], context: str) ->
     return errors
 
 
-def _validate_tick_counter(condition: Mapping[str, Any], context: str, name: str) -> List[str]:
-    errors: List[str] = []
-    value = condition.get("value")
-    if not isinstance(value, int):
-        errors.append(f"{context}: '{name}' requires an integer 'value'.")
-    return errors
+def _validate_tick_counter_at_least(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _suffix: str = _TMPL_INT_VALUE.format("", "tick_counter_at_least"),
+) -> Sequence[str]:
+    if isinstance(condition.get("value"), int):
+        return _NO_ERRORS
+    return (context + _suffix,)
 
 
-def _validate_time_window(condition: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
+def _validate_tick_counter_at_most(
+    condition: Mapping[str, Any],
+    context: str,
+    *_: Any,
+    _suffix: str = _TMPL_INT_VALUE.format("", "tick_counter_at_most"),
+) -> Sequence[str]:
+    if isinstance(condition.get("value"), int):
+        return _NO_ERRORS
+    return (context + _suffix,)
+
+
+def _validate_no_fields(condition: Mapping[str, Any], context: str, *_: Any) -> Sequence[str]:
+    return _NO_ERRORS
+
+
+def _validate_time_window(condition: Mapping[str, Any], context: str) -> Sequence[str]:
     start = condition.get("start")
     end = condition.get("end")
+    if isinstance(start, int) and isinstance(end, int):
+        return _NO_ERRORS
+    errors: List[str] = []
     if not isinstance(start, int):
         errors.append(f"{context}: 'time_window' requires an integer 'start'.")
     if not isinstance(end, int):
@@ -233,40 +508,42 @@ def _validate_time_window(condition: Mapping[str, Any], context: str) -> List[st
     return errors
 
 
-def _validate_add_tag(effect: Mapping[str, Any], context: str, name: str) -> List[str]:
-    errors: List[str] = []
-    value = effect.get("value")
-    if not is_non_empty_str(value):
-        errors.append(f"{context}: '{name}' requires a non-empty string 'value'.")
-    return errors
-
-
-def _validate_set_flag(effect: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
-    flag = effect.get("flag")
-    value = effect.get("value")
-    if not is_non_empty_str(flag):
-        errors.append(f"{context}: 'set_flag' requires a non-empty string 'flag'.")
-    if not simple_value(value):
-        errors.append(f"{context}: 'set_flag' requires a simple literal 'value'.")
-    return errors
-
-
-def _validate_set_profile_flag(effect: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
-    flag = effect.get("flag")
-    value = effect.get("value")
-    if not is_non_empty_str(flag):
-        errors.append(f"{context}: 'set_profile_flag' requires a non-empty string 'flag'.")
-    if not simple_value(value):
-        errors.append(f"{context}: 'set_profile_flag' requires a simple literal 'value'.")
-    return errors
-
-
-def _validate_rep_delta(effect: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
+_NO_ERRORS: Tuple[str, ...] = ()
+
+
+def _compile_value_nes(rule: str) -> Callable[..., List[str]]:
+    """Compile a specialized validator for rules whose only requirement is a
+    non-empty string ``value``.
+
+    The generated function inlines the field lookup and type test with its
+    constants bound as defaults, so a successful validation is a handful of
+    LOAD_FAST ops and no allocations.
+    """
+    template = _TEMPLATES.setdefault(
+        rule, f"{{}}: '{rule}' requires a non-empty string 'value'."
+    )
+    suffix = template.format("")
+    name = f"_validate_{rule}"
+    source = (
+        f"def {name}(payload, context, *_, _suffix=_suffix, _no=_no, _str=str):\n"
+        "    value = payload.get('value')\n"
+        "    if value.__class__ is _str and value and not value.isspace():\n"
+        "        return _no\n"
+        "    return (context + _suffix,)\n"
+    )
+    namespace = {"_suffix": suffix, "_no": _NO_ERRORS}
+    exec(compile(source, f"<world_schema:{rule}>", "exec"), namespace)
+    validator = namespace[name]
+    validator.__qualname__ = f"world_schema.{name}"
+    return validator
+
+
+def _validate_rep_delta(effect: Mapping[str, Any], context: str, *_: Any) -> Sequence[str]:
     faction = effect.get("faction")
     value = effect.get("value")
+    if is_non_empty_str(faction) and isinstance(value, int):
+        return _NO_ERRORS
+    errors: List[str] = []
     if not is_non_empty_str(faction):
         errors.append(f"{context}: 'rep_delta' requires a non-empty string 'faction'.")
     if not isinstance(value, int):
@@ -274,265 +551,327 @@ def _validate_rep_delta(effect: Mapping[str, Any], context: str) -> List[str]:
     return errors
 
 
-def _validate_hp_delta(effect: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
+def _validate_hp_delta(effect: Mapping[str, Any], context: str, *_: Any) -> Sequence[str]:
+    if isinstance(effect.get("value"), int):
+        return _NO_ERRORS
+    return (f"{context}: 'hp_delta' requires an integer 'value'.",)
+
+
+def _validate_var_delta(
+    effect: Mapping[str, Any], context: str, *_: Any, name: str = "var_delta"
+) -> Sequence[str]:
+    var = effect.get("var")
     value = effect.get("value")
+    if is_non_empty_str(var) and isinstance(value, int):
+        return _NO_ERRORS
+    errors: List[str] = []
+    if not is_non_empty_str(var):
+        errors.append(f"{context}: '{name}' requires a non-empty string 'var'.")
     if not isinstance(value, int):
-        errors.append(f"{context}: 'hp_delta' requires an integer 'value'.")
+        errors.append(_TMPL_INT_VALUE.format(context, name))
     return errors
 
 
-def _validate_var_value(effect: Mapping[str, Any], context: str, name: str) -> List[str]:
-    errors: List[str] = []
+def _validate_set_var(
+    effect: Mapping[str, Any], context: str, *_: Any, name: str = "set_var"
+) -> Sequence[str]:
     var = effect.get("var")
     value = effect.get("value")
+    if is_non_empty_str(var) and isinstance(value, int):
+        return _NO_ERRORS
+    errors: List[str] = []
     if not is_non_empty_str(var):
         errors.append(f"{context}: '{name}' requires a non-empty string 'var'.")
     if not isinstance(value, int):
-        errors.append(f"{context}: '{name}' requires an integer 'value'.")
+        errors.append(_TMPL_INT_VALUE.format(context, name))
     return errors
 
 
+def build_teleport_targets(
+    nodes: Mapping[str, Any], endings: Mapping[str, Any]
+) -> frozenset:
+    """Return the set of valid teleport destinations for a world."""
+    return frozenset(nodes).union(endings)
+
+
+# Single-entry memo for the current world's teleport targets. The cached
+# nodes/endings mappings are held strongly, so the identity check cannot be
+# fooled by id() reuse; validating a different world simply rebuilds it.
+_teleport_targets_memo: Tuple[Mapping[str, Any], Mapping[str, Any], frozenset] | None = None
+
+
 def _validate_teleport(
     effect: Mapping[str, Any], context: str, nodes: Mapping[str, Any], endings: Mapping[str, Any]
-) -> List[str]:
-    errors: List[str] = []
+) -> Sequence[str]:
+    global _teleport_targets_memo
     target = effect.get("target")
     if not is_non_empty_str(target):
-        errors.append(f"{context}: 'teleport' requires a non-empty string 'target'.")
-    elif target not in nodes and target not in endings:
-        errors.append(f"{context}: teleport target '{target}' does not exist.")
-    return errors
+        return (f"{context}: 'teleport' requires a non-empty string 'target'.",)
+    memo = _teleport_targets_memo
+    if memo is None or memo[0] is not nodes or memo[1] is not endings:
+        memo = (nodes, endings, build_teleport_targets(nodes, endings))
+        _teleport_targets_memo = memo
+    if target not in memo[2]:
+        return (f"{context}: teleport target '{target}' does not exist.",)
+    return _NO_ERRORS
 
 
 def _validate_end_game(
-    effect: Mapping[str, Any], context: str, endings: Mapping[str, Any]
-) -> List[str]:
-    errors: List[str] = []
+    effect: Mapping[str, Any], context: str, nodes: Mapping[str, Any], endings: Mapping[str, Any]
+) -> Sequence[str]:
     ending = effect.get("value")
     if not is_non_empty_str(ending):
-        errors.append(f"{context}: 'end_game' requires a non-empty string 'value'.")
-    elif ending not in endings:
-        errors.append(f"{context}: ending '{ending}' is not defined.")
-    return errors
+        return (f"{context}: 'end_game' requires a non-empty string 'value'.",)
+    if ending not in endings:
+        return (f"{context}: ending '{ending}' is not defined.",)
+    return _NO_ERRORS
 
 
-def _validate_unlock_start(effect: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
-    value = effect.get("value")
-    if not is_non_empty_str(value):
-        errors.append(f"{context}: 'unlock_start' requires a non-empty string 'value'.")
-    return errors
-
-
-def _validate_grant_legacy_tag(effect: Mapping[str, Any], context: str) -> List[str]:
-    errors: List[str] = []
-    value = effect.get("value")
-    if not is_non_empty_str(value):
-        errors.append(f"{context}: 'grant_legacy_tag' requires a non-empty string 'value'.")
-    return errors
-
-
-CONDITION_SPECS: Dict[str, ConditionSpec] = {
+_CONDITION_SPECS: Dict[str, ConditionSpec] = {
     "flag_eq": ConditionSpec(
         required_fields=("flag", "value"),
         optional_fields=(),
-        field_rules={"flag": "non-empty string", "value": "simple literal (string/int/bool/null)"},
-        validate=_validate_flag_eq,
+        field_rules=(
+            ("flag", "non-empty string"),
+            ("value", "simple literal (string/int/bool/null)"),
+        ),
+        validate=_flag_and_value_validator("flag_eq"),
     ),
     "has_tag": ConditionSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "tag string or non-empty list of tag strings"},
-        validate=lambda condition, context: _validate_has_tag(condition, context, "has_tag"),
+        field_rules=(("value", "tag string or non-empty list of tag strings"),),
+        validate=_validate_has_tag,
     ),
     "has_advanced_tag": ConditionSpec(
         required_fields=(),
         optional_fields=("value",),
-        field_rules={"value": "optional tag string or list of tag strings"},
+        field_rules=(("value", "optional tag string or list of tag strings"),),
         validate=_validate_has_advanced_tag,
     ),
     "has_trait": ConditionSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "trait string or non-empty list of trait strings"},
-        validate=lambda condition, context: _validate_has_tag(condition, context, "has_trait"),
+        field_rules=(("value", "trait string or non-empty list of trait strings"),),
+        validate=_validate_has_trait,
     ),
     "missing_tag": ConditionSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "tag string or non-empty list of tag strings"},
-        validate=lambda condition, context: _validate_has_tag(condition, context, "missing_tag"),
+        field_rules=(("value", "tag string or non-empty list of tag strings"),),
+        validate=_validate_missing_tag,
     ),
     "rep_at_least": ConditionSpec(
         required_fields=("faction", "value"),
         optional_fields=(),
-        field_rules={"faction": "non-empty string", "value": "integer reputation threshold"},
+        field_rules=(("faction", "non-empty string"), ("value", "integer reputation threshold")),
         validate=_validate_rep_at_least,
     ),
     "has_var_gte": ConditionSpec(
         required_fields=("var", "value"),
         optional_fields=(),
-        field_rules={"var": "non-empty string", "value": "integer resource threshold"},
+        field_rules=(("value", "integer resource threshold"), ("var", "non-empty string")),
         validate=_validate_has_var_gte,
     ),
     "rep_at_least_count": ConditionSpec(
         required_fields=("value",),
         optional_fields=("count", "factions"),
-        field_rules={
-            "value": "integer reputation threshold",
-            "count": "optional integer count",
-            "factions": "optional faction string or list of faction strings",
-        },
+        field_rules=(
+            ("count", "optional integer count"),
+            ("factions", "optional faction string or list of faction strings"),
+            ("value", "integer reputation threshold"),
+        ),
         validate=_validate_rep_at_least_count,
     ),
     "profile_flag_eq": ConditionSpec(
         required_fields=("flag", "value"),
         optional_fields=(),
-        field_rules={"flag": "non-empty string", "value": "simple literal (string/int/bool/null)"},
-        validate=_validate_profile_flag_eq,
+        field_rules=(
+            ("flag", "non-empty string"),
+            ("value", "simple literal (string/int/bool/null)"),
+        ),
+        validate=_flag_and_value_validator("profile_flag_eq"),
     ),
     "profile_flag_is_true": ConditionSpec(
         required_fields=("flag",),
         optional_fields=(),
-        field_rules={"flag": "non-empty string"},
-        validate=lambda condition, context: _validate_profile_flag_bool(
-            condition, context, "profile_flag_is_true"
-        ),
+        field_rules=(("flag", "non-empty string"),),
+        validate=_validate_profile_flag_is_true,
     ),
     "profile_flag_is_false": ConditionSpec(
         required_fields=("flag",),
         optional_fields=(),
-        field_rules={"flag": "non-empty string"},
-        validate=lambda condition, context: _validate_profile_flag_bool(
-            condition, context, "profile_flag_is_false"
-        ),
+        field_rules=(("flag", "non-empty string"),),
+        validate=_validate_profile_flag_is_false,
     ),
     "tick_counter_at_least": ConditionSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "integer tick counter minimum"},
-        validate=lambda condition, context: _validate_tick_counter(
-            condition, context, "tick_counter_at_least"
-        ),
+        field_rules=(("value", "integer tick counter minimum"),),
+        validate=_validate_tick_counter_at_least,
     ),
     "tick_counter_at_most": ConditionSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "integer tick counter maximum"},
-        validate=lambda condition, context: _validate_tick_counter(
-            condition, context, "tick_counter_at_most"
-        ),
+        field_rules=(("value", "integer tick counter maximum"),),
+        validate=_validate_tick_counter_at_most,
     ),
     "time_window": ConditionSpec(
         required_fields=("start", "end"),
         optional_fields=(),
-        field_rules={"start": "integer start hour", "end": "integer end hour"},
+        field_rules=(("end", "integer end hour"), ("start", "integer start hour")),
         validate=_validate_time_window,
     ),
     "doom_reached": ConditionSpec(
         required_fields=(),
         optional_fields=(),
-        field_rules={},
-        validate=lambda condition, context: [],
+        field_rules=(),
+        validate=_validate_no_fields,
     ),
     "doom_not_reached": ConditionSpec(
         required_fields=(),
         optional_fields=(),
-        field_rules={},
-        validate=lambda condition, context: [],
+        field_rules=(),
+        validate=_validate_no_fields,
     ),
 }
 
-EFFECT_SPECS: Dict[str, EffectSpec] = {
+# Read-only views: the spec tables are shared module state consumed by the
+# engine, web runtime and tools; freezing them keeps accidental mutation out
+# and makes the shared dicts safe to cache against.
+_finalize_specs(_CONDITION_SPECS)
+CONDITION_SPECS: Mapping[str, ConditionSpec] = MappingProxyType(_CONDITION_SPECS)
+
+_EFFECT_SPECS: Dict[str, EffectSpec] = {
     "set_flag": EffectSpec(
         required_fields=("flag", "value"),
         optional_fields=(),
-        field_rules={"flag": "non-empty string", "value": "simple literal (string/int/bool/null)"},
-        validate=lambda effect, context, nodes, endings: _validate_set_flag(effect, context),
+        field_rules=(
+            ("flag", "non-empty string"),
+            ("value", "simple literal (string/int/bool/null)"),
+        ),
+        validate=_flag_and_value_validator("set_flag"),
     ),
     "add_tag": EffectSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "non-empty string tag"},
-        validate=lambda effect, context, nodes, endings: _validate_add_tag(effect, context, "add_tag"),
+        field_rules=(("value", "non-empty string tag"),),
+        validate=_compile_value_nes("add_tag"),
     ),
     "remove_tag": EffectSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "non-empty string tag"},
-        validate=lambda effect, context, nodes, endings: _validate_add_tag(
-            effect, context, "remove_tag"
-        ),
+        field_rules=(("value", "non-empty string tag"),),
+        validate=_compile_value_nes("remove_tag"),
     ),
     "add_trait": EffectSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "non-empty string trait"},
-        validate=lambda effect, context, nodes, endings: _validate_add_tag(effect, context, "add_trait"),
+        field_rules=(("value", "non-empty string trait"),),
+        validate=_compile_value_nes("add_trait"),
     ),
     "rep_delta": EffectSpec(
         required_fields=("faction", "value"),
         optional_fields=(),
-        field_rules={"faction": "non-empty string", "value": "integer reputation delta"},
-        validate=lambda effect, context, nodes, endings: _validate_rep_delta(effect, context),
+        field_rules=(("faction", "non-empty string"), ("value", "integer reputation delta")),
+        validate=_validate_rep_delta,
     ),
     "hp_delta": EffectSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "integer hit point delta"},
-        validate=lambda effect, context, nodes, endings: _validate_hp_delta(effect, context),
+        field_rules=(("value", "integer hit point delta"),),
+        validate=_validate_hp_delta,
     ),
     "var_delta": EffectSpec(
         required_fields=("var", "value"),
         optional_fields=(),
-        field_rules={"var": "non-empty string", "value": "integer resource delta"},
-        validate=lambda effect, context, nodes, endings: _validate_var_value(
-            effect, context, "var_delta"
-        ),
+        field_rules=(("value", "integer resource delta"), ("var", "non-empty string")),
+        validate=_validate_var_delta,
     ),
     "set_var": EffectSpec(
         required_fields=("var", "value"),
         optional_fields=(),
-        field_rules={"var": "non-empty string", "value": "integer resource value"},
-        validate=lambda effect, context, nodes, endings: _validate_var_value(
-            effect, context, "set_var"
-        ),
+        field_rules=(("value", "integer resource value"), ("var", "non-empty string")),
+        validate=_validate_set_var,
     ),
     "teleport": EffectSpec(
         required_fields=("target",),
         optional_fields=(),
-        field_rules={"target": "non-empty string node or ending id"},
-        validate=lambda effect, context, nodes, endings: _validate_teleport(
-            effect, context, nodes, endings
-        ),
+        field_rules=(("target", "non-empty string node or ending id"),),
+        validate=_validate_teleport,
     ),
     "end_game": EffectSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "non-empty string ending id"},
-        validate=lambda effect, context, nodes, endings: _validate_end_game(effect, context, endings),
+        field_rules=(("value", "non-empty string ending id"),),
+        validate=_validate_end_game,
     ),
     "unlock_start": EffectSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "non-empty string start id"},
-        validate=lambda effect, context, nodes, endings: _validate_unlock_start(effect, context),
+        field_rules=(("value", "non-empty string start id"),),
+        validate=_compile_value_nes("unlock_start"),
     ),
     "set_profile_flag": EffectSpec(
         required_fields=("flag", "value"),
         optional_fields=(),
-        field_rules={"flag": "non-empty string", "value": "simple literal (string/int/bool/null)"},
-        validate=lambda effect, context, nodes, endings: _validate_set_profile_flag(
-            effect, context
+        field_rules=(
+            ("flag", "non-empty string"),
+            ("value", "simple literal (string/int/bool/null)"),
         ),
+        validate=_flag_and_value_validator("set_profile_flag"),
     ),
     "grant_legacy_tag": EffectSpec(
         required_fields=("value",),
         optional_fields=(),
-        field_rules={"value": "non-empty string tag"},
-        validate=lambda effect, context, nodes, endings: _validate_grant_legacy_tag(
-            effect, context
-        ),
+        field_rules=(("value", "non-empty string tag"),),
+        validate=_compile_value_nes("grant_legacy_tag"),
     ),
 }
+
+_finalize_specs(_EFFECT_SPECS)
+EFFECT_SPECS: Mapping[str, EffectSpec] = MappingProxyType(_EFFECT_SPECS)
+
+
+def iter_condition_errors(condition: Mapping[str, Any], context: str = "") -> Iterator[str]:
+    """Yield validation errors for one condition object, lazily.
+
+    Callers that only need a verdict can stop at the first error instead of
+    materializing the full list.
+    """
+    cond_type = condition.get("type")
+    spec = CONDITION_SPECS.get(cond_type)
+    if spec is None:
+        yield f"{context}: unsupported condition type '{cond_type}'."
+        return
+    yield from spec.validate(condition, context)
+
+
+def condition_is_valid(condition: Mapping[str, Any], context: str = "") -> bool:
+    """Short-circuit check: True once no error is produced."""
+    return next(iter_condition_errors(condition, context), None) is None
+
+
+def iter_effect_errors(
+    effect: Mapping[str, Any],
+    context: str,
+    nodes: Mapping[str, Any],
+    endings: Mapping[str, Any],
+) -> Iterator[str]:
+    """Yield validation errors for one effect object, lazily."""
+    effect_type = effect.get("type")
+    spec = EFFECT_SPECS.get(effect_type)
+    if spec is None:
+        yield f"{context}: unsupported effect type '{effect_type}'."
+        return
+    yield from spec.validate(effect, context, nodes, endings)
+
+
+def effect_is_valid(
+    effect: Mapping[str, Any],
+    context: str,
+    nodes: Mapping[str, Any],
+    endings: Mapping[str, Any],
+) -> bool:
+    """Short-circuit check: True once no error is produced."""
+    return next(iter_effect_errors(effect, context, nodes, endings), None) is None
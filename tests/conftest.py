@@ -1,8 +1,34 @@
 from __future__ import annotations
 
+import copy
+import os
 import sys
 from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(scope="session")
+def world_cache() -> "Callable[[str], Dict[str, Any]]":
+    """Session-wide memo for parsed worlds, keyed by path and mtime.
+
+    load_world re-parses and re-validates the whole file on every call;
+    caching it once per session keeps repeated tests cheap. Hand-outs are
+    deep copies so tests may mutate their world freely.
+    """
+    from engine.engine_min import load_world
+
+    cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def _load(path: str) -> Dict[str, Any]:
+        key = (path, os.stat(path).st_mtime_ns)
+        if key not in cache:
+            cache[key] = load_world(path)
+        return copy.deepcopy(cache[key])
+
+    return _load
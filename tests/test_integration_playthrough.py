@@ -6,7 +6,6 @@ from engine.engine_min import (
     apply_effects,
     canonicalize_tag_list,
     list_choices,
-    load_world,
     record_seen_ending,
 )
 from engine.profile_manager import default_profile, save_profile
@@ -25,35 +24,42 @@ def pick_start(world: dict, profile: dict) -> tuple[str, list[str]]:
 
 def simulate_random_playthrough(state: GameState, *, seed: int, max_steps: int = 2000) -> str:
     rng = random.Random(seed)
+    # Hoisted out of the loop: these lookups repeat up to max_steps times and
+    # the referenced containers are mutated in place, never replaced.
+    nodes = state.world["nodes"]
+    endings = state.world.get("endings", {})
+    player = state.player
+    flags = player["flags"]
+    rng_choice = rng.choice
     steps = 0
     while steps < max_steps:
         steps += 1
         node_id = state.current_node
-        node = state.world["nodes"].get(node_id)
+        node = nodes.get(node_id)
         assert node is not None, f"Missing node '{node_id}'."
 
         apply_effects(node.get("on_enter"), state)
-        if "__ending__" in state.player["flags"]:
-            return state.player["flags"]["__ending__"]
+        if "__ending__" in flags:
+            return flags["__ending__"]
 
-        if node_id in state.world.get("endings", {}):
-            ending_name = state.world["endings"][node_id]
+        if node_id in endings:
+            ending_name = endings[node_id]
             record_seen_ending(state, ending_name)
             return ending_name
 
         visible = list_choices(node, state)
         assert visible, f"No available choices from node '{node_id}'."
 
-        choice = rng.choice(visible)
+        choice = rng_choice(visible)
         apply_effects(choice.get("effects"), state)
-        if "__ending__" in state.player["flags"]:
-            return state.player["flags"]["__ending__"]
+        if "__ending__" in flags:
+            return flags["__ending__"]
 
         target = choice.get("target")
         if target:
             state.record_transition(node_id, target, choice.get("text", "choice"))
             state.current_node = target
-        if state.player["hp"] <= 0:
+        if player["hp"] <= 0:
             demise = "A Short Tale"
             record_seen_ending(state, demise)
             return demise
@@ -61,8 +67,8 @@ def simulate_random_playthrough(state: GameState, *, seed: int, max_steps: int =
     raise AssertionError(f"Playthrough exceeded {max_steps} steps without reaching an ending.")
 
 
-def test_random_playthrough_reaches_ending(tmp_path: Path) -> None:
-    world = load_world("world/world.json")
+def test_random_playthrough_reaches_ending(tmp_path: Path, world_cache) -> None:
+    world = world_cache("world/world.json")
     profile = default_profile()
     profile_path = tmp_path / "profile.json"
     save_profile(profile, profile_path)
@@ -0,0 +1,52 @@
+"""Optional compiled BFS kernel for tools.reachability.
+
+Importing this module requires numpy and numba; tools.reachability guards
+the import and falls back to its pure-Python traversal when either is
+missing. The kernel works on a CSR-encoded graph so the hot loop is plain
+integer/array code numba compiles well, and cache=True persists the
+compiled function so only the first ever run pays for compilation.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _bfs(indptr, indices, seeds, visited):  # pragma: no cover - requires numba
+    n = visited.shape[0]
+    queue = np.empty(n, dtype=np.int32)
+    tail = 0
+    for i in range(seeds.shape[0]):
+        seed = seeds[i]
+        if not visited[seed]:
+            visited[seed] = 1
+            queue[tail] = seed
+            tail += 1
+    head = 0
+    while head < tail:
+        current = queue[head]
+        head += 1
+        for k in range(indptr[current], indptr[current + 1]):
+            target = indices[k]
+            if not visited[target]:
+                visited[target] = 1
+                queue[tail] = target
+                tail += 1
+
+
+def bfs_from_adjacency(seeds: list[int], graph_adj: list[list[int]]) -> bytearray:
+    """CSR-encode ``graph_adj`` and run the compiled multi-source BFS."""
+    n = len(graph_adj)
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    for ix, edges in enumerate(graph_adj):
+        indptr[ix + 1] = indptr[ix] + len(edges)
+    indices = np.empty(int(indptr[n]), dtype=np.int32)
+    offset = 0
+    for edges in graph_adj:
+        indices[offset : offset + len(edges)] = edges
+        offset += len(edges)
+    visited = np.zeros(n, dtype=np.uint8)
+    _bfs(indptr, indices, np.asarray(seeds, dtype=np.int32), visited)
+    return bytearray(visited)
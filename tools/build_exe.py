@@ -5,14 +5,22 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import hashlib
 import os
+import platform
 import shutil
 import subprocess
+import sys
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_NAME = "Patchwork-Isles"
 
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tools.build_release import fast_rmtree, source_digest
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -34,13 +42,26 @@ def parse_args() -> argparse.Namespace:
         help="Optional tag string to append to the artifact name (ex: v0.9-beta).",
     )
     parser.add_argument(
-        "--keep-build-dir",
+        "--force-rebuild",
         action="store_true",
-        help="Do not delete the temporary build directory.",
+        help="Discard the persistent PyInstaller work dir before building.",
     )
     return parser.parse_args()
 
 
+def cache_key() -> str:
+    """Key the cached executable on sources, interpreter, and platform.
+
+    PyInstaller output depends on all three; any change invalidates the
+    cached binary.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(source_digest().encode())
+    digest.update(sys.version.encode())
+    digest.update(platform.platform().encode())
+    return digest.hexdigest()
+
+
 def artifact_name(base: str, tag: str | None) -> str:
     date_stamp = dt.datetime.utcnow().strftime("%Y%m%d")
     if tag:
@@ -48,13 +69,28 @@ def artifact_name(base: str, tag: str | None) -> str:
     return f"{base}-{date_stamp}"
 
 
-def build_executable(output_dir: Path, name: str, tag: str | None, keep_build_dir: bool) -> Path:
+def build_executable(output_dir: Path, name: str, tag: str | None, force_rebuild: bool) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     artifact_base = artifact_name(name, tag)
-    stage_dir = output_dir / f".{artifact_base}-pyinstaller"
-    if stage_dir.exists():
-        shutil.rmtree(stage_dir)
-    stage_dir.mkdir(parents=True)
+    artifact_path = output_dir / artifact_base
+    if os.name == "nt":
+        artifact_path = artifact_path.with_suffix(".exe")
+
+    # A PyInstaller run costs 30-90s; reuse the previous binary when nothing
+    # it depends on has changed.
+    cache_dir = output_dir / ".cache"
+    cached_binary = cache_dir / f"{cache_key()}.bin"
+    if cached_binary.exists():
+        shutil.copy2(cached_binary, artifact_path)
+        return artifact_path
+
+    # Persistent work dir: PyInstaller keeps its dependency analysis and
+    # stripped-binary caches here between runs, which is most of the cost of
+    # a warm rebuild. --force-rebuild starts it fresh.
+    stage_dir = REPO_ROOT / ".pyinstaller-cache"
+    if force_rebuild and stage_dir.exists():
+        fast_rmtree(stage_dir)
+    stage_dir.mkdir(parents=True, exist_ok=True)
 
     world_src = REPO_ROOT / "world"
     entry_point = REPO_ROOT / "engine" / "engine_min.py"
@@ -66,7 +102,6 @@ def build_executable(output_dir: Path, name: str, tag: str | None, keep_build_di
         "-m",
         "PyInstaller",
         "--noconfirm",
-        "--clean",
         "--onefile",
         "--name",
         artifact_base,
@@ -81,14 +116,14 @@ def build_executable(output_dir: Path, name: str, tag: str | None, keep_build_di
         str(entry_point),
     ]
 
-    subprocess.run(command, check=True)
-
-    artifact_path = output_dir / artifact_base
-    if os.name == "nt":
-        artifact_path = artifact_path.with_suffix(".exe")
+    env = dict(os.environ, PYINSTALLER_CONFIG_DIR=str(stage_dir / "config"))
+    subprocess.run(command, check=True, env=env)
 
-    if not keep_build_dir:
-        shutil.rmtree(stage_dir)
+    cache_dir.mkdir(exist_ok=True)
+    try:
+        os.link(artifact_path, cached_binary)
+    except OSError:
+        shutil.copy2(artifact_path, cached_binary)
 
     return artifact_path
 
@@ -96,7 +131,7 @@ def build_executable(output_dir: Path, name: str, tag: str | None, keep_build_di
 def main() -> None:
     args = parse_args()
     output_dir = Path(args.output_dir)
-    artifact_path = build_executable(output_dir, args.name, args.tag, args.keep_build_dir)
+    artifact_path = build_executable(output_dir, args.name, args.tag, args.force_rebuild)
     print(f"Executable created: {artifact_path}")
 
 
@@ -1,9 +1,13 @@
 import argparse
-import json
 from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
+try:  # Optional fast JSON parser; world files run to megabytes.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is not a required dependency
+    from json import loads as _json_loads
+
 DEFAULT_WORLD_PATH = Path("world/world.json")
 
 CORE_TAGS = [
@@ -21,10 +25,13 @@ CORE_TAGS = [
     "Resonant",
 ]
 
+# Membership probes in the audit loops go through the frozenset; the list
+# keeps its authoring order for reports.
+CORE_TAGS_SET = frozenset(CORE_TAGS)
+
 
 def load_world(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _json_loads(path.read_bytes())
 
 
 def infer_hub(node_id: str) -> str:
@@ -36,15 +43,24 @@ def infer_hub(node_id: str) -> str:
     return parts[0]
 
 
+_TAG_CONDITION_TYPES = frozenset({"has_tag", "has_advanced_tag"})
+
+
 def iter_has_tag_conditions(payload: Any) -> Iterable[Dict[str, Any]]:
-    if isinstance(payload, dict):
-        if payload.get("type") in {"has_tag", "has_advanced_tag"}:
-            yield payload
-        for value in payload.values():
-            yield from iter_has_tag_conditions(value)
-    elif isinstance(payload, list):
-        for entry in payload:
-            yield from iter_has_tag_conditions(entry)
+    # Explicit stack instead of recursive generators: deeply nested all_of/
+    # any_of trees otherwise pay a generator frame per level per yield. The
+    # payloads come straight from json.load, so exact-type checks are safe.
+    found: List[Dict[str, Any]] = []
+    stack = [payload]
+    while stack:
+        current = stack.pop()
+        if type(current) is dict:
+            if current.get("type") in _TAG_CONDITION_TYPES:
+                found.append(current)
+            stack.extend(current.values())
+        elif type(current) is list:
+            stack.extend(current)
+    return found
 
 
 def extract_tags(condition: Dict[str, Any]) -> List[str]:
@@ -59,26 +75,34 @@ def extract_tags(condition: Dict[str, Any]) -> List[str]:
 
 
 def audit(world: Dict[str, Any]) -> int:
-    global_counts: Counter[str] = Counter()
-    hub_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+    # Plain dicts in the counting loop; Counter only wraps them at print
+    # time, where most_common's sort is worth its cost.
+    global_counts: Dict[str, int] = {}
+    hub_counts: Dict[str, Dict[str, int]] = {}
 
+    global_get = global_counts.get
     for node_id, node in world.get("nodes", {}).items():
-        hub_id = infer_hub(node_id)
+        # Resolved lazily so hubs whose nodes gate nothing on tags never get
+        # an (empty) entry in the report.
+        hub_tags = None
         for choice in node.get("choices", []) or []:
             for condition in iter_has_tag_conditions(choice.get("condition")):
                 for tag in extract_tags(condition):
-                    global_counts[tag] += 1
-                    hub_counts[hub_id][tag] += 1
+                    if hub_tags is None:
+                        hub_tags = hub_counts.setdefault(infer_hub(node_id), {})
+                        hub_get = hub_tags.get
+                    global_counts[tag] = global_get(tag, 0) + 1
+                    hub_tags[tag] = hub_get(tag, 0) + 1
 
     print("Per-hub tag coverage:")
     for hub_id in sorted(hub_counts):
         print(f"  {hub_id}:")
-        for tag, count in hub_counts[hub_id].most_common():
+        for tag, count in Counter(hub_counts[hub_id]).most_common():
             print(f"    {tag}: {count}")
     print()
 
     print("Global tag coverage:")
-    for tag, count in global_counts.most_common():
+    for tag, count in Counter(global_counts).most_common():
         print(f"  {tag}: {count}")
     print()
 
@@ -86,16 +110,16 @@ def audit(world: Dict[str, Any]) -> int:
 
     print("Balance checks:")
 
-    missing_core = [tag for tag in CORE_TAGS if global_counts[tag] < 10]
+    missing_core = [tag for tag in CORE_TAGS if global_get(tag, 0) < 10]
     if missing_core:
         exit_code = 1
         print("  [FAIL] Core tags below 10 uses:")
         for tag in missing_core:
-            print(f"    - {tag}: {global_counts[tag]}")
+            print(f"    - {tag}: {global_get(tag, 0)}")
     else:
         print("  [OK] All core tags appear at least 10 times.")
 
-    advanced_tags = sorted(tag for tag in global_counts if tag not in CORE_TAGS)
+    advanced_tags = sorted(tag for tag in global_counts if tag not in CORE_TAGS_SET)
     missing_adv = [tag for tag in advanced_tags if global_counts[tag] < 4]
     if missing_adv:
         exit_code = 1
@@ -107,9 +131,9 @@ def audit(world: Dict[str, Any]) -> int:
 
     undercovered = defaultdict(list)
     for tag in CORE_TAGS:
-        if global_counts[tag] < 8:
+        if global_get(tag, 0) < 8:
             for hub_id, counts in hub_counts.items():
-                if counts[tag]:
+                if counts.get(tag):
                     undercovered[hub_id].append(tag)
 
     if undercovered:
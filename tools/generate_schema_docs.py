@@ -38,14 +38,22 @@ def _render_prompts_block() -> str:
     )
 
 
-def _replace_block(path: Path, new_block: str) -> None:
+def _replace_block(path: Path, new_block: str) -> bool:
+    """Rewrite the marked block; return whether the file actually changed.
+
+    Skipping the write on idempotent runs keeps the file's mtime stable, so
+    git status, editors, and anything else watching these docs see no churn.
+    """
     content = path.read_text()
     if MARKER_START not in content or MARKER_END not in content:
         raise RuntimeError(f"Markers not found in {path}.")
     before, rest = content.split(MARKER_START, 1)
     _, after = rest.split(MARKER_END, 1)
     updated = f"{before}{MARKER_START}\n{new_block}\n{MARKER_END}{after}"
+    if updated == content:
+        return False
     path.write_text(updated)
+    return True
 
 
 def main() -> None:
@@ -53,10 +61,16 @@ def main() -> None:
     readme_path = repo_root / "README.md"
     prompts_path = repo_root / "docs" / "prompts.md"
 
-    _replace_block(readme_path, _render_block())
-    _replace_block(prompts_path, _render_prompts_block())
+    changed = []
+    if _replace_block(readme_path, _render_block()):
+        changed.append(readme_path.name)
+    if _replace_block(prompts_path, _render_prompts_block()):
+        changed.append(prompts_path.name)
 
-    print("Updated schema docs. Regenerate docs with: python tools/generate_schema_docs.py")
+    if changed:
+        print(f"Updated schema docs in: {', '.join(changed)}.")
+    else:
+        print("Schema docs already up to date; nothing written.")
 
 
 if __name__ == "__main__":
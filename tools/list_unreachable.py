@@ -1,89 +1,22 @@
-import json
 import sys
 from pathlib import Path
 
-DEFAULT_WORLD_PATH = Path("world/world.json")
-
-
-def load_world(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+try:  # Optional fast JSON parser; world files run to megabytes.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is not a required dependency
+    from json import loads as _json_loads
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
-def build_graph(world: dict) -> tuple[dict, list[str]]:
-    nodes = world.get("nodes", {})
-    graph = {node_id: [] for node_id in nodes}
-    missing_targets: list[str] = []
+from tools.reachability import build_graph, intern_graph, traverse_from
 
-    def collect_teleport_targets(effects: object) -> list[str]:
-        if not effects:
-            return []
-        if isinstance(effects, dict):
-            effects_list = [effects]
-        elif isinstance(effects, list):
-            effects_list = effects
-        else:
-            return []
-        targets = []
-        for effect in effects_list:
-            if not isinstance(effect, dict):
-                continue
-            if effect.get("type") != "teleport":
-                continue
-            target = effect.get("target")
-            if isinstance(target, str):
-                targets.append(target)
-        return targets
-
-    def collect_choice_targets(target: object) -> list[str]:
-        if isinstance(target, str):
-            return [target]
-        if isinstance(target, list):
-            targets: list[str] = []
-            for entry in target:
-                if not isinstance(entry, dict):
-                    continue
-                entry_target = entry.get("target")
-                if isinstance(entry_target, str):
-                    targets.append(entry_target)
-            return targets
-        return []
-
-    for node_id, node in nodes.items():
-        for target in collect_teleport_targets(node.get("on_enter")):
-            graph[node_id].append(target)
-            if target not in nodes:
-                missing_targets.append(
-                    f"Node {node_id} teleports to missing node {target}"
-                )
-        for choice in node.get("choices", []) or []:
-            for target in collect_choice_targets(choice.get("target")):
-                graph[node_id].append(target)
-                if target not in nodes:
-                    missing_targets.append(
-                        f"Node {node_id} choice targets missing node {target}"
-                    )
-            for target in collect_teleport_targets(choice.get("effects")):
-                graph[node_id].append(target)
-                if target not in nodes:
-                    missing_targets.append(
-                        f"Node {node_id} teleports to missing node {target}"
-                    )
-    return graph, missing_targets
+DEFAULT_WORLD_PATH = Path("world/world.json")
 
 
-def traverse_from(start_node: str, graph: dict) -> set:
-    if start_node not in graph:
-        return set()
-    visited = set()
-    stack = [start_node]
-    while stack:
-        current = stack.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-        stack.extend(graph.get(current, []))
-    return visited
+def load_world(path: Path) -> dict:
+    return _json_loads(path.read_bytes())
 
 
 def main() -> None:
@@ -92,19 +25,19 @@ def main() -> None:
     graph, missing_targets = build_graph(world)
     starts = world.get("starts", [])
 
-    all_reached = set()
-    for start in starts:
-        node = start.get("node")
-        if not isinstance(node, str):
-            continue
-        reached = traverse_from(node, graph)
-        all_reached.update(reached)
+    node_ids, id_to_idx, graph_adj = intern_graph(graph)
+    seeds = [
+        id_to_idx[start["node"]]
+        for start in starts
+        if isinstance(start.get("node"), str) and start["node"] in id_to_idx
+    ]
+    visited = traverse_from(seeds, graph_adj)
 
-    unreachable = sorted(set(graph.keys()) - all_reached)
+    unreachable = sorted(node_id for node_id in node_ids if not visited[id_to_idx[node_id]])
 
     print(f"World file: {world_path}")
     print(f"Total nodes: {len(graph)}")
-    print(f"Reachable nodes: {len(all_reached)}")
+    print(f"Reachable nodes: {sum(visited)}")
     if unreachable:
         print("Unreachable nodes:")
         for node_id in unreachable:
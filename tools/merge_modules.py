@@ -5,18 +5,24 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Mapping
 
+try:  # Optional fast JSON parser; module files run to megabytes combined.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is not a required dependency
+    from json import loads as _json_loads
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_WORLD_PATH = REPO_ROOT / "world" / "world.json"
 DEFAULT_MODULES_DIR = REPO_ROOT / "world" / "modules"
 
 
 def load_json(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _json_loads(path.read_bytes())
 
 
 def ensure_world_structure(world: Dict[str, Any]) -> Dict[str, Any]:
@@ -51,10 +57,23 @@ def ensure_world_structure(world: Dict[str, Any]) -> Dict[str, Any]:
     return world
 
 
-def extract_nodes(module: Mapping[str, Any], module_name: str, errors: list[str]) -> Dict[str, Any]:
+def merge_nodes(
+    module: Mapping[str, Any],
+    module_name: str,
+    base_nodes: Dict[str, Any],
+    errors: list[str],
+) -> None:
+    """Merge a module's nodes straight into ``base_nodes``.
+
+    Inserting directly keeps peak memory at one raw module plus the merged
+    world instead of also materializing a per-module node dict (previously
+    the single largest intermediate). Validation messages and their order
+    are unchanged: conflict errors are deferred so they still follow the
+    module's own shape/duplicate errors.
+    """
     raw_nodes = module.get("nodes")
     if raw_nodes is None:
-        return {}
+        return
 
     entries: list[tuple[str, Any]] = []
     if isinstance(raw_nodes, dict):
@@ -73,9 +92,10 @@ def extract_nodes(module: Mapping[str, Any], module_name: str, errors: list[str]
             entries.append((node_id, payload))
     else:
         errors.append(f"{module_name}: 'nodes' must be an object or a list of node entries.")
-        return {}
+        return
 
-    nodes: Dict[str, Any] = {}
+    seen: set[str] = set()
+    conflicts: list[str] = []
     for node_id, payload in entries:
         if not isinstance(node_id, str) or not node_id.strip():
             errors.append(f"{module_name}: node id '{node_id}' must be a non-empty string.")
@@ -83,29 +103,45 @@ def extract_nodes(module: Mapping[str, Any], module_name: str, errors: list[str]
         if not isinstance(payload, Mapping):
             errors.append(f"{module_name}: node '{node_id}' must be an object definition.")
             continue
-        if node_id in nodes:
+        if node_id in seen:
             errors.append(f"{module_name}: node '{node_id}' defined multiple times.")
             continue
-        nodes[node_id] = dict(payload)
-
-    return nodes
+        seen.add(node_id)
+        if node_id in base_nodes:
+            conflicts.append(f"{module_name}: node '{node_id}' already exists in base world.")
+        else:
+            base_nodes[node_id] = payload if type(payload) is dict else dict(payload)
+    errors.extend(conflicts)
 
 
 def merge_world(base_world: Dict[str, Any], modules_dir: Path) -> tuple[Dict[str, Any], list[Path]]:
     base = ensure_world_structure(base_world)
     errors: list[str] = []
-    module_files = sorted(p for p in modules_dir.glob("*.json") if p.is_file())
+    # Parallel set so faction dedup stays O(1) per lookup while the list
+    # keeps its insertion order for output.
+    seen_factions = set(base["factions"])
+    # scandir answers is_file() from the readdir buffer, avoiding the extra
+    # stat() per entry that glob + Path.is_file() costs.
+    module_files = sorted(
+        (
+            Path(entry.path)
+            for entry in os.scandir(modules_dir)
+            if entry.is_file() and entry.name.endswith(".json")
+        ),
+        key=lambda path: path.name,
+    )
+
+    # File reads (and, with orjson, most of the decode) release the GIL, so
+    # modules parse concurrently. The merge itself stays on this thread:
+    # dict mutation is not thread-safe and must run in module-file order
+    # anyway to keep error messages deterministic.
+    with ThreadPoolExecutor() as executor:
+        parsed = list(executor.map(load_json, module_files))
 
-    for module_path in module_files:
-        data = load_json(module_path)
+    for module_path, data in zip(module_files, parsed):
         module_name = module_path.name
 
-        module_nodes = extract_nodes(data, module_name, errors)
-        for node_id, node_payload in module_nodes.items():
-            if node_id in base["nodes"]:
-                errors.append(f"{module_name}: node '{node_id}' already exists in base world.")
-            else:
-                base["nodes"][node_id] = node_payload
+        merge_nodes(data, module_name, base["nodes"], errors)
 
         module_endings = data.get("endings")
         if module_endings is not None:
@@ -133,7 +169,8 @@ def merge_world(base_world: Dict[str, Any], modules_dir: Path) -> tuple[Dict[str
                 errors.append(f"{module_name}: 'factions' must be a list.")
             else:
                 for faction in module_factions:
-                    if isinstance(faction, str) and faction not in base["factions"]:
+                    if isinstance(faction, str) and faction not in seen_factions:
+                        seen_factions.add(faction)
                         base["factions"].append(faction)
 
     if errors:
@@ -164,6 +201,16 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Optional path for the merged output. Defaults to --world path.",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=(
+            "Write the merged world with compact separators instead of the "
+            "default 4-space indent. Cuts file size roughly a third and "
+            "speeds up later loads; the committed world.json stays pretty "
+            "so its diffs remain reviewable."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -193,7 +240,10 @@ def main() -> None:
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(merged, handle, indent=4, ensure_ascii=False)
+        if args.compact:
+            json.dump(merged, handle, separators=(",", ":"), ensure_ascii=False)
+        else:
+            json.dump(merged, handle, indent=4, ensure_ascii=False)
         handle.write("\n")
 
     print(f"Merged {len(module_files)} module(s) into {output_path}.")
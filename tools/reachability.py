@@ -0,0 +1,118 @@
+"""Shared world-graph construction and reachability traversal.
+
+Both list_unreachable and world_health_report need the same node graph;
+this module keeps the one (teleport- and conditional-target-aware) copy of
+that logic so future graph work lands in a single place.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+try:  # Optional compiled BFS kernel; needs numpy + numba.
+    from tools._bfs_numba import bfs_from_adjacency as _bfs_compiled
+except ImportError:  # pragma: no cover - numba is not a required dependency
+    _bfs_compiled = None
+
+
+def collect_teleport_targets(effects: object) -> Iterator[str]:
+    """Yield teleport target ids from an on_enter/effects payload.
+
+    A generator so every caller walks the payload once without an
+    intermediate target list per node or choice.
+    """
+    if isinstance(effects, dict):
+        effects = (effects,)
+    elif not isinstance(effects, list):
+        return
+    for effect in effects:
+        if isinstance(effect, dict) and effect.get("type") == "teleport":
+            target = effect.get("target")
+            if isinstance(target, str):
+                yield target
+
+
+def collect_choice_targets(target: object) -> list[str]:
+    if isinstance(target, str):
+        return [target]
+    if isinstance(target, list):
+        targets: list[str] = []
+        for entry in target:
+            if not isinstance(entry, dict):
+                continue
+            entry_target = entry.get("target")
+            if isinstance(entry_target, str):
+                targets.append(entry_target)
+        return targets
+    return []
+
+
+def build_graph(world: dict, include_teleports: bool = True) -> tuple[dict, list[str]]:
+    """Build the node graph plus a list of edges to nodes that do not exist.
+
+    Covers plain and conditional-list choice targets; ``include_teleports``
+    can be switched off for choice-only analyses.
+    """
+    nodes = world.get("nodes", {})
+    graph: dict[str, list[str]] = {node_id: [] for node_id in nodes}
+    missing_targets: list[str] = []
+
+    for node_id, node in nodes.items():
+        if include_teleports:
+            for target in collect_teleport_targets(node.get("on_enter")):
+                graph[node_id].append(target)
+                if target not in nodes:
+                    missing_targets.append(
+                        f"Node {node_id} teleports to missing node {target}"
+                    )
+        for choice in node.get("choices", []) or []:
+            for target in collect_choice_targets(choice.get("target")):
+                graph[node_id].append(target)
+                if target not in nodes:
+                    missing_targets.append(
+                        f"Node {node_id} choice targets missing node {target}"
+                    )
+            if include_teleports:
+                for target in collect_teleport_targets(choice.get("effects")):
+                    graph[node_id].append(target)
+                    if target not in nodes:
+                        missing_targets.append(
+                            f"Node {node_id} teleports to missing node {target}"
+                        )
+    return graph, missing_targets
+
+
+def intern_graph(graph: dict) -> tuple[list[str], dict[str, int], list[list[int]]]:
+    """One-time id->index interning; edges to missing nodes are dropped here
+    (callers report those separately via build_graph's missing_targets).
+    """
+    node_ids = list(graph)
+    id_to_idx = {node_id: idx for idx, node_id in enumerate(node_ids)}
+    graph_adj = [
+        [id_to_idx[target] for target in graph[node_id] if target in id_to_idx]
+        for node_id in node_ids
+    ]
+    return node_ids, id_to_idx, graph_adj
+
+
+def traverse_from(seeds: list[int], graph_adj: list[list[int]]) -> bytearray:
+    """Return a visited mark per node, reachable from any seed index.
+
+    A single multi-source traversal seeded with every start at once: each
+    node and edge is processed once total rather than once per start. Works
+    on interned integer indices so the inner loop tests and marks visitation
+    by bytearray indexing instead of hashing node-id strings. When numba is
+    installed the walk runs as a compiled kernel over a CSR copy of the
+    graph instead of this Python loop.
+    """
+    if _bfs_compiled is not None:
+        return _bfs_compiled(seeds, graph_adj)
+    visited = bytearray(len(graph_adj))
+    stack = list(seeds)
+    while stack:
+        current = stack.pop()
+        if visited[current]:
+            continue
+        visited[current] = 1
+        stack.extend(graph_adj[current])
+    return visited
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
-from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+from collections import deque
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
 
 from engine.world_schema import normalize_nodes, path
 
@@ -22,131 +22,192 @@ GATED_CONDITION_TYPES = {
 }
 
 
+class SoftlockWarning(NamedTuple):
+    """One analyzer finding; the message renders on demand.
+
+    Keeping the pieces unformatted means callers that only count or filter
+    warnings never pay for the f-string assembly, and several chain
+    warnings about the same node share one joined choice-path string.
+    """
+
+    node_path: str
+    kind: str  # "all_gated" or "chain"
+    start: Optional[str]
+    choices: str
+
+    def render(self) -> str:
+        if self.kind == "all_gated":
+            return f"{self.node_path}: all choices are gated. Choices: {self.choices}."
+        return (
+            f"{self.node_path}: traversal from start '{self.start}'"
+            f" hit node with no ungated exits. Choices: {self.choices}."
+        )
+
+
 def _is_gated_condition(condition: Any) -> bool:
-    if condition in (None, {}, []):
-        return False
-    if isinstance(condition, Sequence) and not isinstance(condition, (str, bytes, Mapping)):
-        return any(_is_gated_condition(entry) for entry in condition)
-    if not isinstance(condition, Mapping):
-        return True
-    cond_type = condition.get("type")
-    if not isinstance(cond_type, str):
-        return True
-    if cond_type in GATED_CONDITION_TYPES:
-        return True
-    return cond_type.startswith("profile_flag_")
-
-
-def _iter_choices(
-    nodes: Mapping[str, Any],
-) -> Iterable[Tuple[str, int, Mapping[str, Any], str, Any, Tuple[object, ...]]]:
-    for node_id, node in nodes.items():
-        choices = node.get("choices")
-        if not isinstance(choices, Sequence) or isinstance(choices, (str, bytes)):
+    # Iterative walk with an early return; the recursive version built a
+    # generator per nested sequence and kept resuming it even after a gated
+    # entry had been found deeper down. Conditions come straight from
+    # json.load, so exact list/dict checks are safe and skip the ABC
+    # __instancecheck__ walk.
+    stack = [condition]
+    while stack:
+        entry = stack.pop()
+        if entry in (None, {}, []):
             continue
-        for index, choice in enumerate(choices):
-            if isinstance(choice, Mapping):
-                target = choice.get("target")
-                if isinstance(target, str):
-                    yield (
-                        node_id,
-                        index,
-                        choice,
-                        target,
-                        None,
-                        ("nodes", node_id, "choices", index, "target"),
-                    )
-                elif isinstance(target, Sequence) and not isinstance(target, (str, bytes)):
-                    for target_index, entry in enumerate(target):
-                        if not isinstance(entry, Mapping):
-                            continue
-                        entry_target = entry.get("target")
-                        if isinstance(entry_target, str):
-                            yield (
-                                node_id,
-                                index,
-                                choice,
-                                entry_target,
-                                entry.get("condition"),
-                                ("nodes", node_id, "choices", index, "target", target_index),
-                            )
-
-
-def analyze_softlocks(world: Mapping[str, Any]) -> List[str]:
+        if type(entry) is list:
+            stack.extend(entry)
+            continue
+        if type(entry) is not dict:
+            return True
+        cond_type = entry.get("type")
+        if not isinstance(cond_type, str):
+            return True
+        if cond_type in GATED_CONDITION_TYPES or cond_type.startswith("profile_flag_"):
+            return True
+    return False
+
+
+def analyze_softlocks(world: Mapping[str, Any]) -> List[SoftlockWarning]:
     nodes, _ = normalize_nodes(world.get("nodes"))
     endings = world.get("endings")
-    if not isinstance(endings, Mapping):
+    if not isinstance(endings, dict):
         endings = {}
 
-    choice_meta: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for node_id, index, choice, target, entry_condition, target_path in _iter_choices(nodes):
-        gated = _is_gated_condition(choice.get("condition"))
-        if entry_condition is not None:
-            gated = gated or _is_gated_condition(entry_condition)
-        choice_path = path(*target_path)
-        meta = {
-            "index": index,
-            "target": target,
-            "gated": gated,
-            "path": choice_path,
-        }
-        choice_meta[node_id].append(meta)
-
-    warnings: List[str] = []
-
-    for node_id, choices in choice_meta.items():
-        if not choices:
+    # Parallel per-node lists instead of one dict per choice: gated status
+    # and targets are computed once here, so the traversal below does plain
+    # indexed scans with no per-visit dict lookups or re-filtering.
+    node_targets: Dict[str, List[str]] = {}
+    node_gated: Dict[str, List[bool]] = {}
+    node_paths: Dict[str, List[str]] = {}
+    has_any_ungated: Dict[str, bool] = {}
+    # path() re-renders its full part tuple on every call; cache the
+    # "nodes.<id>" prefix per node and append the fixed-shape choice suffix
+    # with an f-string, which matches path()'s rendering exactly because
+    # "choices"/"target" are plain identifiers and indices render as [n].
+    node_prefix: Dict[str, str] = {}
+    # The choice walk is inlined (the old _iter_choices generator allocated
+    # a 6-tuple per choice just to unpack it here) and a choice's own
+    # condition is classified once even when its target list fans out into
+    # several conditional entries.
+    for node_id, node in nodes.items():
+        choices = node.get("choices")
+        if type(choices) is not list:
             continue
-        ungated = [choice for choice in choices if not choice["gated"]]
-        if not ungated:
-            choice_paths = ", ".join(choice["path"] for choice in choices)
-            warnings.append(
-                f"{path('nodes', node_id)}: all choices are gated. Choices: {choice_paths}."
-            )
+        targets = gated_flags = paths = None
+        prefix = ""
+        for index, choice in enumerate(choices):
+            if type(choice) is not dict:
+                continue
+            target = choice.get("target")
+            if isinstance(target, str):
+                if targets is None:
+                    targets = node_targets[node_id] = []
+                    gated_flags = node_gated[node_id] = []
+                    paths = node_paths[node_id] = []
+                    has_any_ungated[node_id] = False
+                    prefix = node_prefix[node_id] = path("nodes", node_id)
+                gated = _is_gated_condition(choice.get("condition"))
+                targets.append(target)
+                gated_flags.append(gated)
+                paths.append(f"{prefix}.choices[{index}].target")
+                if not gated:
+                    has_any_ungated[node_id] = True
+            elif type(target) is list:
+                choice_gated = None
+                for target_index, entry in enumerate(target):
+                    if type(entry) is not dict:
+                        continue
+                    entry_target = entry.get("target")
+                    if not isinstance(entry_target, str):
+                        continue
+                    if targets is None:
+                        targets = node_targets[node_id] = []
+                        gated_flags = node_gated[node_id] = []
+                        paths = node_paths[node_id] = []
+                        has_any_ungated[node_id] = False
+                        prefix = node_prefix[node_id] = path("nodes", node_id)
+                    if choice_gated is None:
+                        choice_gated = _is_gated_condition(choice.get("condition"))
+                    entry_condition = entry.get("condition")
+                    gated = choice_gated or (
+                        entry_condition is not None and _is_gated_condition(entry_condition)
+                    )
+                    targets.append(entry_target)
+                    gated_flags.append(gated)
+                    paths.append(f"{prefix}.choices[{index}].target[{target_index}]")
+                    if not gated:
+                        has_any_ungated[node_id] = True
+
+    warnings: List[SoftlockWarning] = []
+
+    # Joined choice-path strings for dead nodes, shared by the all-gated
+    # warning here and every chain warning about the same node below.
+    dead_choices: Dict[str, str] = {}
+    for node_id, choice_paths in node_paths.items():
+        if not has_any_ungated[node_id]:
+            joined = ", ".join(choice_paths)
+            dead_choices[node_id] = joined
+            warnings.append(SoftlockWarning(node_prefix[node_id], "all_gated", None, joined))
 
     starts = world.get("starts", [])
-    if not isinstance(starts, Sequence) or isinstance(starts, (str, bytes)):
+    if not isinstance(starts, list):
         starts = []
 
     start_nodes = []
     for start in starts:
-        if isinstance(start, Mapping):
+        if isinstance(start, dict):
             node_ref = start.get("node")
             if isinstance(node_ref, str):
                 start_nodes.append(node_ref)
 
-    def traverse(start_node: str, ungated_only: bool) -> Tuple[set[str], List[str]]:
-        visited: set[str] = set()
-        queue: deque[str] = deque([start_node])
-        chain_warnings: List[str] = []
+    # One-time id->index interning: the traversal below works on small ints
+    # and bytearray marks instead of hashing node-id strings per step. The
+    # adjacency lists hold only the edges the walk may follow (ungated, not
+    # an ending, target exists), so the inner loop is a plain extend.
+    ix_to_id = list(nodes)
+    id_to_ix = {node_id: ix for ix, node_id in enumerate(ix_to_id)}
+    adjacency: List[List[int]] = [[] for _ in ix_to_id]
+    warn_flags = bytearray(len(ix_to_id))
+    # Pre-rendered warning pieces for dead-chain nodes, so a node warned
+    # from several starts joins its choice paths once, not per visit.
+    warn_prefix: Dict[int, str] = {}
+    warn_choices: Dict[int, str] = {}
+    for node_id, targets in node_targets.items():
+        if not has_any_ungated[node_id]:
+            ix = id_to_ix[node_id]
+            warn_flags[ix] = 1
+            warn_prefix[ix] = node_prefix[node_id]
+            warn_choices[ix] = dead_choices[node_id]
+        gated_flags = node_gated[node_id]
+        edges = adjacency[id_to_ix[node_id]]
+        for index, target in enumerate(targets):
+            if gated_flags[index] or target in endings:
+                continue
+            target_ix = id_to_ix.get(target)
+            if target_ix is not None:
+                edges.append(target_ix)
+
+    def traverse(start_node: str) -> List[SoftlockWarning]:
+        """Walk ungated edges from ``start_node``, warning on dead chains."""
+        visited = bytearray(len(ix_to_id))
+        queue: deque[int] = deque([id_to_ix[start_node]])
+        chain_warnings: List[SoftlockWarning] = []
         while queue:
-            node_id = queue.popleft()
-            if node_id in visited:
+            ix = queue.popleft()
+            if visited[ix]:
                 continue
-            visited.add(node_id)
-            choices = choice_meta.get(node_id, [])
-            if ungated_only and choices:
-                ungated = [choice for choice in choices if not choice["gated"]]
-                if not ungated:
-                    choice_paths = ", ".join(choice["path"] for choice in choices)
-                    chain_warnings.append(
-                        f"{path('nodes', node_id)}: traversal from start '{start_node}'"
-                        f" hit node with no ungated exits. Choices: {choice_paths}."
-                    )
-            for choice in choices:
-                if ungated_only and choice["gated"]:
-                    continue
-                target = choice.get("target")
-                if not isinstance(target, str) or target in endings:
-                    continue
-                if target in nodes:
-                    queue.append(target)
-        return visited, chain_warnings
+            visited[ix] = 1
+            if warn_flags[ix]:
+                chain_warnings.append(
+                    SoftlockWarning(warn_prefix[ix], "chain", start_node, warn_choices[ix])
+                )
+            queue.extend(adjacency[ix])
+        return chain_warnings
 
     for start_node in start_nodes:
         if start_node not in nodes:
             continue
-        _, chain_warnings = traverse(start_node, ungated_only=True)
-        warnings.extend(chain_warnings)
+        warnings.extend(traverse(start_node))
 
     return warnings
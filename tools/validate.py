@@ -9,19 +9,20 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, Sequence
 
+try:  # Optional fast JSON parser; world files run to megabytes.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is not a required dependency
+    from json import loads as _json_loads
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_WORLD = REPO_ROOT / "world" / "world.json"
 
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from engine.engine_min import load_world
-from tools.softlock import analyze_softlocks
-
 
 def load_json(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _json_loads(path.read_bytes())
 
 
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
@@ -37,6 +38,12 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
 
 def main(argv: Sequence[str]) -> None:
     args = parse_args(argv[1:])
+
+    # Deferred until after argument parsing: pulling in the engine compiles
+    # every schema validator, which --help invocations should not pay for.
+    from engine.engine_min import load_world
+    from tools.softlock import analyze_softlocks
+
     world_path = Path(args.world_path).resolve()
     try:
         world = load_world(world_path)
@@ -51,7 +58,7 @@ def main(argv: Sequence[str]) -> None:
     if warnings:
         print("Soft-lock warnings (path: message):")
         for warning in warnings:
-            print(f" - {warning}")
+            print(f" - {warning.render()}")
 
     print(f"Validation passed for {world_path}.")
 
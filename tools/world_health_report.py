@@ -10,9 +10,25 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, NamedTuple
+
+try:  # Optional fast JSON parser/serializer; world files run to megabytes.
+    import orjson
+except ImportError:  # pragma: no cover - orjson is not a required dependency
+    orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tools.reachability import (
+    collect_choice_targets,
+    collect_teleport_targets,
+    intern_graph,
+    traverse_from,
+)
+
 DEFAULT_WORLD = REPO_ROOT / "world" / "world.json"
 DEFAULT_BUDGET_DOC = REPO_ROOT / "docs" / "planning" / "content-budgets.md"
 DEFAULT_JSON_OUT = REPO_ROOT / "world_health_report.json"
@@ -23,100 +39,48 @@ LOCALIZATION_KEY_FIELDS = {"loc_key", "loc_id", "localization_key"}
 WORD_RE = re.compile(r"\b\w+\b", re.UNICODE)
 
 
-@dataclass
-class BudgetStats:
+class BudgetStats(NamedTuple):
+    """Per-module content counts; a tuple so totals fold componentwise."""
+
     nodes: int = 0
     choices: int = 0
     words: int = 0
 
 
 def load_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
-def count_words(text: str | None) -> int:
+def count_words(text: str | None, _finditer=WORD_RE.finditer) -> int:
     if not text:
         return 0
-    return len(WORD_RE.findall(text))
-
-
-def collect_teleport_targets(effects: object) -> list[str]:
-    if not effects:
-        return []
-    if isinstance(effects, dict):
-        effects_list = [effects]
-    elif isinstance(effects, list):
-        effects_list = effects
-    else:
-        return []
-    targets = []
-    for effect in effects_list:
-        if not isinstance(effect, dict):
-            continue
-        if effect.get("type") != "teleport":
-            continue
-        target = effect.get("target")
-        if isinstance(target, str):
-            targets.append(target)
-    return targets
-
-
-def build_graph(world: dict) -> tuple[dict[str, list[str]], list[str]]:
-    nodes = world.get("nodes", {})
-    graph = {node_id: [] for node_id in nodes}
-    missing_targets: list[str] = []
-
-    for node_id, node in nodes.items():
-        for target in collect_teleport_targets(node.get("on_enter")):
-            graph[node_id].append(target)
-            if target not in nodes:
-                missing_targets.append(f"Node {node_id} teleports to missing node {target}")
-        for choice in node.get("choices", []) or []:
-            target = choice.get("target")
-            if isinstance(target, str):
-                graph[node_id].append(target)
-                if target not in nodes:
-                    missing_targets.append(
-                        f"Node {node_id} choice targets missing node {target}"
-                    )
-            for target in collect_teleport_targets(choice.get("effects")):
-                graph[node_id].append(target)
-                if target not in nodes:
-                    missing_targets.append(f"Node {node_id} teleports to missing node {target}")
-    return graph, missing_targets
-
-
-def traverse_from(start_node: str, graph: dict[str, list[str]]) -> set[str]:
-    if start_node not in graph:
-        return set()
-    visited = set()
-    stack = [start_node]
-    while stack:
-        current = stack.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-        stack.extend(graph.get(current, []))
-    return visited
-
-
-def iter_conditions(condition: Any) -> Iterable[dict[str, Any]]:
-    if isinstance(condition, list):
-        for entry in condition:
-            yield from iter_conditions(entry)
-    elif isinstance(condition, dict):
-        yield condition
-        nested = condition.get("conditions")
-        if isinstance(nested, list):
-            for entry in nested:
-                yield from iter_conditions(entry)
+    # finditer counts matches without materializing the full list of words;
+    # the bound method is a keyword default so the hot path skips the
+    # module-global and attribute lookups per call.
+    return sum(1 for _ in _finditer(text))
 
 
 def is_tag_gated(condition: Any) -> bool:
+    # Explicit stack with an early return: no generator frame per nesting
+    # level, and the walk stops at the first gating type instead of
+    # resuming/exhausting generators the way the old iter_conditions did.
     if condition is None:
         return False
-    return any(item.get("type") in TAG_GATING_TYPES for item in iter_conditions(condition))
+    stack = [condition]
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, list):
+            stack.extend(entry)
+        elif isinstance(entry, dict):
+            if entry.get("type") in TAG_GATING_TYPES:
+                return True
+            nested = entry.get("conditions")
+            if isinstance(nested, list):
+                stack.extend(nested)
+    return False
 
 
 def has_localization_key(entry: dict, field_name: str) -> bool:
@@ -125,7 +89,32 @@ def has_localization_key(entry: dict, field_name: str) -> bool:
     return f"{field_name}_key" in entry
 
 
-def collect_missing_localization(world: dict, max_entries: int) -> dict[str, Any]:
+@dataclass
+class ScanResult:
+    graph: dict[str, list[str]]
+    missing_targets: set[str]
+    dead_ends: set[str]
+    total_choices: int
+    tag_gated_choices: int
+    missing_localization: dict[str, Any]
+
+
+def scan_world(world: dict, max_missing_localization: int) -> ScanResult:
+    """Collect graph edges, tag-gate density, and localization gaps in one pass.
+
+    main previously walked the node dict three times (graph build, density
+    loop, localization scan), re-descending the same nested structures each
+    time; fusing them touches every node and choice once.
+    """
+    nodes = world.get("nodes", {})
+    graph: dict[str, list[str]] = {node_id: [] for node_id in nodes}
+    # Sets from the start: the report only ever wants these deduplicated
+    # and sorted, so there is no point accumulating duplicate messages.
+    missing_targets: set[str] = set()
+    dead_ends: set[str] = set()
+    total_choices = 0
+    tag_gated_choices = 0
+
     missing: list[dict[str, str]] = []
     total_missing = 0
 
@@ -134,7 +123,7 @@ def collect_missing_localization(world: dict, max_entries: int) -> dict[str, Any
         if has_localization_key(entry, field):
             return
         total_missing += 1
-        if len(missing) < max_entries:
+        if len(missing) < max_missing_localization:
             missing.append({"path": path, "text": text_value})
 
     world_title = world.get("title")
@@ -149,9 +138,15 @@ def collect_missing_localization(world: dict, max_entries: int) -> dict[str, Any
             if isinstance(value, str):
                 record(f"starts.{start.get('id', '<unknown>')}.{field}", value, start, field)
 
-    for node_id, node in world.get("nodes", {}).items():
+    for node_id, node in nodes.items():
+        edges = graph[node_id]
         if not isinstance(node, dict):
+            dead_ends.add(node_id)
             continue
+        for target in collect_teleport_targets(node.get("on_enter")):
+            edges.append(target)
+            if target not in nodes:
+                missing_targets.add(f"Node {node_id} teleports to missing node {target}")
         for field in ("title", "text"):
             value = node.get(field)
             if isinstance(value, str):
@@ -159,9 +154,22 @@ def collect_missing_localization(world: dict, max_entries: int) -> dict[str, Any
         for index, choice in enumerate(node.get("choices", []) or []):
             if not isinstance(choice, dict):
                 continue
+            for target in collect_choice_targets(choice.get("target")):
+                edges.append(target)
+                if target not in nodes:
+                    missing_targets.add(f"Node {node_id} choice targets missing node {target}")
+            for target in collect_teleport_targets(choice.get("effects")):
+                edges.append(target)
+                if target not in nodes:
+                    missing_targets.add(f"Node {node_id} teleports to missing node {target}")
+            total_choices += 1
+            if is_tag_gated(choice.get("condition")):
+                tag_gated_choices += 1
             value = choice.get("text")
             if isinstance(value, str):
                 record(f"nodes.{node_id}.choices[{index}].text", value, choice, "text")
+        if not edges:
+            dead_ends.add(node_id)
 
     endings = world.get("endings", {})
     if isinstance(endings, dict):
@@ -169,14 +177,21 @@ def collect_missing_localization(world: dict, max_entries: int) -> dict[str, Any
             if not isinstance(value, str):
                 continue
             total_missing += 1
-            if len(missing) < max_entries:
+            if len(missing) < max_missing_localization:
                 missing.append({"path": f"endings.{key}", "text": value})
 
-    return {
-        "count": total_missing,
-        "examples": missing,
-        "limit": max_entries,
-    }
+    return ScanResult(
+        graph=graph,
+        missing_targets=missing_targets,
+        dead_ends=dead_ends,
+        total_choices=total_choices,
+        tag_gated_choices=tag_gated_choices,
+        missing_localization={
+            "count": total_missing,
+            "examples": missing,
+            "limit": max_missing_localization,
+        },
+    )
 
 
 def parse_budget_doc(path: Path) -> dict[str, Any] | None:
@@ -192,36 +207,47 @@ def parse_budget_doc(path: Path) -> dict[str, Any] | None:
         return None
 
 
-def gather_module_stats(world: dict, node_prefixes: list[str]) -> BudgetStats:
-    stats = BudgetStats()
-    nodes = world.get("nodes", {})
-    for node_id, node in nodes.items():
+def gather_module_stats(
+    world: dict, module_prefixes: list[tuple[str, tuple[str, ...]]]
+) -> dict[str, BudgetStats]:
+    """Accumulate stats for every module in one pass over the nodes.
+
+    One scan assigns each node to all modules whose prefix matches (the
+    same multi-membership the old per-module scans produced), and the
+    word/choice counts for a node are computed once no matter how many
+    modules claim it.
+    """
+    counters = {module_id: [0, 0, 0] for module_id, _ in module_prefixes}
+    for node_id, node in world.get("nodes", {}).items():
         if not isinstance(node_id, str) or not isinstance(node, dict):
             continue
-        if not any(node_id.startswith(prefix) for prefix in node_prefixes):
-            continue
-        stats.nodes += 1
-        stats.words += count_words(node.get("title"))
-        stats.words += count_words(node.get("text"))
-        for choice in node.get("choices", []) or []:
-            if not isinstance(choice, dict):
+        node_words = -1
+        node_choices = 0
+        for module_id, prefixes in module_prefixes:
+            if not node_id.startswith(prefixes):
                 continue
-            stats.choices += 1
-            stats.words += count_words(choice.get("text"))
-    return stats
+            if node_words < 0:
+                node_words = count_words(node.get("title")) + count_words(node.get("text"))
+                for choice in node.get("choices", []) or []:
+                    if not isinstance(choice, dict):
+                        continue
+                    node_choices += 1
+                    node_words += count_words(choice.get("text"))
+            counter = counters[module_id]
+            counter[0] += 1
+            counter[1] += node_choices
+            counter[2] += node_words
+    return {module_id: BudgetStats(*counter) for module_id, counter in counters.items()}
 
 
 def compare_budget(stats: BudgetStats, budget: dict[str, Any]) -> dict[str, Any]:
     overages = {}
-    for key, value in (
-        ("nodes", budget.get("max_nodes")),
-        ("choices", budget.get("max_choices")),
-        ("words", budget.get("max_words")),
-    ):
-        if isinstance(value, int) and getattr(stats, key) > value:
-            overages[key] = getattr(stats, key) - value
+    limits = (budget.get("max_nodes"), budget.get("max_choices"), budget.get("max_words"))
+    for key, amount, limit in zip(BudgetStats._fields, stats, limits):
+        if isinstance(limit, int) and amount > limit:
+            overages[key] = amount - limit
     return {
-        "stats": {"nodes": stats.nodes, "choices": stats.choices, "words": stats.words},
+        "stats": stats._asdict(),
         "budget": budget,
         "over_budget": bool(overages),
         "overages": overages,
@@ -235,8 +261,10 @@ def build_content_budget_report(world: dict, budget_doc: Path) -> dict[str, Any]
 
     report: dict[str, Any] = {"modules": {}, "chapters": {}, "doc_path": str(budget_doc)}
     modules = budgets.get("modules", {}) if isinstance(budgets, dict) else {}
-    module_stats_cache: dict[str, BudgetStats] = {}
 
+    # str.startswith takes the whole prefix tuple at once, so each module
+    # costs one C-level call per node in the shared scan below.
+    module_prefixes: list[tuple[str, tuple[str, ...]]] = []
     for module_id, module_budget in modules.items():
         if not isinstance(module_budget, dict):
             continue
@@ -246,9 +274,13 @@ def build_content_budget_report(world: dict, budget_doc: Path) -> dict[str, Any]
                 f"Module {module_id} has no node_prefixes configured."
             )
             continue
-        stats = gather_module_stats(world, prefixes)
-        module_stats_cache[module_id] = stats
-        report["modules"][module_id] = compare_budget(stats, module_budget)
+        module_prefixes.append((module_id, tuple(prefixes)))
+
+    module_stats_cache = gather_module_stats(world, module_prefixes)
+    for module_id, module_budget in modules.items():
+        stats = module_stats_cache.get(module_id)
+        if stats is not None:
+            report["modules"][module_id] = compare_budget(stats, module_budget)
 
     chapters = budgets.get("chapters", {}) if isinstance(budgets, dict) else {}
     for chapter_id, chapter_budget in chapters.items():
@@ -260,16 +292,17 @@ def build_content_budget_report(world: dict, budget_doc: Path) -> dict[str, Any]
                 f"Chapter {chapter_id} has no module_ids configured."
             )
             continue
-        totals = BudgetStats()
+        chapter_stats = []
         missing_modules = []
         for module_id in module_ids:
             stats = module_stats_cache.get(module_id)
             if stats is None:
                 missing_modules.append(module_id)
-                continue
-            totals.nodes += stats.nodes
-            totals.choices += stats.choices
-            totals.words += stats.words
+            else:
+                chapter_stats.append(stats)
+        # Chapter totals fold componentwise over the module tuples instead
+        # of three attribute increments per module.
+        totals = BudgetStats(*map(sum, zip(*chapter_stats)))
         chapter_report = compare_budget(totals, chapter_budget)
         if missing_modules:
             chapter_report["missing_modules"] = missing_modules
@@ -278,7 +311,7 @@ def build_content_budget_report(world: dict, budget_doc: Path) -> dict[str, Any]
     return report
 
 
-def build_markdown(report: dict[str, Any]) -> str:
+def build_markdown_lines(report: dict[str, Any]) -> list[str]:
     missing_loc = report["missing_localization"]
     tag_gate = report["tag_gate_density"]
     content_budgets = report.get("content_budgets", {})
@@ -360,7 +393,7 @@ def build_markdown(report: dict[str, Any]) -> str:
                 lines.append(f"  - Overages: {chapter_report['overages']}")
     lines.append("")
 
-    return "\n".join(lines)
+    return lines
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -405,31 +438,24 @@ def main(argv: list[str]) -> int:
         print(f"Failed to parse JSON from {world_path}: {exc}")
         return 1
 
-    graph, missing_targets = build_graph(world)
+    scan = scan_world(world, args.max_missing_localization)
+    graph, missing_targets = scan.graph, scan.missing_targets
     starts = world.get("starts", [])
-    all_reached: set[str] = set()
-    for start in starts:
-        if not isinstance(start, dict):
-            continue
-        node = start.get("node")
-        if not isinstance(node, str):
-            continue
-        all_reached.update(traverse_from(node, graph))
-
-    unreachable = sorted(set(graph.keys()) - all_reached)
-    dead_ends = sorted([node_id for node_id, edges in graph.items() if not edges])
-
-    total_choices = 0
-    tag_gated_choices = 0
-    for node in world.get("nodes", {}).values():
-        if not isinstance(node, dict):
-            continue
-        for choice in node.get("choices", []) or []:
-            if not isinstance(choice, dict):
-                continue
-            total_choices += 1
-            if is_tag_gated(choice.get("condition")):
-                tag_gated_choices += 1
+    node_ids, id_to_idx, graph_adj = intern_graph(graph)
+    seeds = [
+        id_to_idx[start["node"]]
+        for start in starts
+        if isinstance(start, dict)
+        and isinstance(start.get("node"), str)
+        and start["node"] in id_to_idx
+    ]
+    visited = traverse_from(seeds, graph_adj)
+
+    unreachable = sorted(node_id for node_id in node_ids if not visited[id_to_idx[node_id]])
+    dead_ends = sorted(scan.dead_ends)
+
+    total_choices = scan.total_choices
+    tag_gated_choices = scan.tag_gated_choices
 
     edge_count = sum(len(edges) for edges in graph.values())
     average_branching_factor = edge_count / len(graph) if graph else 0.0
@@ -439,11 +465,9 @@ def main(argv: list[str]) -> int:
         "world_path": str(world_path),
         "node_count": len(graph),
         "unreachable_nodes": unreachable,
-        "missing_targets": sorted(set(missing_targets)),
+        "missing_targets": sorted(missing_targets),
         "dead_ends": dead_ends,
-        "missing_localization": collect_missing_localization(
-            world, args.max_missing_localization
-        ),
+        "missing_localization": scan.missing_localization,
         "tag_gate_density": {
             "tag_gated_choices": tag_gated_choices,
             "total_choices": total_choices,
@@ -454,10 +478,22 @@ def main(argv: list[str]) -> int:
     }
 
     json_out_path = Path(args.json_out)
-    json_out_path.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    if orjson is not None:
+        json_out_path.write_bytes(
+            orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+    else:
+        # json.dump streams to the file instead of materializing the whole
+        # serialized report as one string first.
+        with json_out_path.open("w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
 
     markdown_out_path = Path(args.markdown_out)
-    markdown_out_path.write_text(build_markdown(report), encoding="utf-8")
+    with markdown_out_path.open("w", encoding="utf-8") as handle:
+        for index, line in enumerate(build_markdown_lines(report)):
+            if index:
+                handle.write("\n")
+            handle.write(line)
 
     print(f"JSON report written to {json_out_path}")
     print(f"Markdown report written to {markdown_out_path}")